@@ -35,6 +35,7 @@ a = Analysis(
         'typer',
         'click',
         'mcp',
+        'orjson',
         *textual_hiddenimports,
         *rich_hiddenimports,
         *app_hiddenimports,
@@ -1,60 +1,180 @@
 """SQLite database for caching jobs and tracking requests."""
 
-import json
+import asyncio
+import sqlite3
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 import aiosqlite
+import orjson
 
 from ..config import get_settings
 from ..models import JobPosting, RequestStats
+from ..utils.parser import parse_experience_years, parse_salary_min
+
+# RETURNING clauses are available from SQLite 3.35
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Stored in PRAGMA user_version; bump when the jobs table layout changes
+SCHEMA_VERSION = 3
+
+# Most distinct queries kept when the query cache is enabled
+_QUERY_CACHE_SIZE = 32
+
+# Seconds a read of this month's request count is reused. Other processes
+# (the CLI next to an open TUI) count requests too, so it has to expire.
+_USAGE_CACHE_TTL = 2.0
+
+# posted_date and fetched_at are unix timestamps in seconds. salary_min_k and
+# exp_min/exp_max are parsed from salary_range/experience when a job is saved,
+# so filters and sorts on them are integer compares.
+_JOBS_TABLE = """
+    CREATE TABLE IF NOT EXISTS jobs (
+        id TEXT PRIMARY KEY,
+        title TEXT NOT NULL,
+        company TEXT NOT NULL,
+        location TEXT,
+        salary_range TEXT,
+        experience TEXT,
+        education TEXT,
+        description TEXT,
+        requirements TEXT,
+        tags TEXT,
+        posted_date INTEGER,
+        url TEXT UNIQUE,
+        source TEXT,
+        fetched_at INTEGER,
+        is_active INTEGER DEFAULT 1,
+        salary_min_k INTEGER,
+        exp_min INTEGER,
+        exp_max INTEGER
+    );
+"""
+
+
+def _parsed_columns(
+    salary_range: Optional[str], experience: Optional[str]
+) -> tuple[Optional[int], Optional[int], Optional[int]]:
+    """Parse the (salary_min_k, exp_min, exp_max) columns for a job."""
+    exp_min, exp_max = parse_experience_years(experience) or (None, None)
+    return parse_salary_min(salary_range), exp_min, exp_max
 
 
 class Database:
     """SQLite database manager for job caching and request tracking."""
 
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(self, db_path: Optional[Path] = None, query_cache_ttl: float = 0):
         """Initialize the database.
 
         Args:
             db_path: Path to SQLite database file. Uses settings default if not provided.
+            query_cache_ttl: Seconds to reuse get_jobs/search_jobs results for
+                identical arguments; 0 disables the cache. Meant for
+                long-lived sessions such as the TUI.
         """
         settings = get_settings()
         self.db_path = db_path or settings.database_path
-        settings.ensure_cache_dir()
-        self._initialized = False
-
-    async def _ensure_initialized(self) -> None:
-        """Ensure database tables are created."""
-        if not self._initialized:
-            async with aiosqlite.connect(self.db_path) as conn:
-                conn.row_factory = aiosqlite.Row
-                await self._init_tables(conn)
-            self._initialized = True
+        self.monthly_request_limit = settings.monthly_request_limit
+        self.cache_expiry_hours = settings.cache_expiry_hours
+        self._conn: Optional[aiosqlite.Connection] = None
+        self._conn_lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
+        self._fts_enabled = False
+        # Metadata writes are buffered here and flushed together
+        self._pending_meta: dict[str, tuple[str, int]] = {}
+        self._meta_flush_task: Optional[asyncio.Task] = None
+        # (month, requests_count, expires_at) as of the last read or increment
+        self._usage_cache: Optional[tuple[str, int, float]] = None
+        # (expires_at, "YYYY-MM") so hot paths don't format the date each call
+        self._month_cache: tuple[float, str] = (0.0, "")
+        # Query arguments -> (expires_at, jobs); cleared on every job write
+        self.query_cache_ttl = query_cache_ttl
+        self._query_cache: dict[tuple, tuple[float, list[JobPosting]]] = {}
+
+    async def __aenter__(self) -> "Database":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _get_conn(self) -> aiosqlite.Connection:
+        """Get the shared connection, opening and initializing it on first use."""
+        if self._conn is None:
+            async with self._conn_lock:
+                if self._conn is None:
+                    conn = await aiosqlite.connect(self.db_path)
+                    conn.row_factory = aiosqlite.Row
+                    await self._configure(conn)
+                    await self._init_tables(conn)
+                    self._conn = conn
+        return self._conn
+
+    async def close(self) -> None:
+        """Flush pending metadata and close the shared connection if it is open."""
+        task, self._meta_flush_task = self._meta_flush_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self._flush_meta()
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+
+    async def _configure(self, conn: aiosqlite.Connection) -> None:
+        """Apply connection pragmas."""
+        # INSERT OR REPLACE only fires the delete triggers that keep the
+        # full-text index in sync when recursive triggers are enabled.
+        await conn.execute("PRAGMA recursive_triggers=ON")
+
+        # Only takes effect on a new database (before the first table is
+        # created); lets compact() return freed pages without a full VACUUM,
+        # which would renumber rowids under the full-text index.
+        await conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+
+        # WAL lets readers run alongside the writer and, with synchronous=NORMAL,
+        # avoids an fsync on every commit. journal_mode persists in the file;
+        # the remaining pragmas apply to this connection only.
+        if str(self.db_path) != ":memory:":
+            await conn.executescript(
+                """
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                PRAGMA temp_store=MEMORY;
+                PRAGMA cache_size=-64000;
+                PRAGMA mmap_size=268435456;
+                """
+            )
 
     async def _init_tables(self, conn: aiosqlite.Connection) -> None:
         """Create database tables if they don't exist."""
-        await conn.executescript(
-            """
-            CREATE TABLE IF NOT EXISTS jobs (
-                id TEXT PRIMARY KEY,
-                title TEXT NOT NULL,
-                company TEXT NOT NULL,
-                location TEXT,
-                salary_range TEXT,
-                experience TEXT,
-                education TEXT,
-                description TEXT,
-                requirements TEXT,
-                tags TEXT,
-                posted_date TEXT,
-                url TEXT UNIQUE,
-                source TEXT,
-                fetched_at TEXT,
-                is_active INTEGER DEFAULT 1
-            );
+        cursor = await conn.execute("PRAGMA user_version")
+        (version,) = await cursor.fetchone()
+        if version == SCHEMA_VERSION:
+            # Created and migrated by an earlier run, so skip the DDL. Only
+            # the full-text index may still be missing, if an earlier SQLite
+            # lacked FTS5.
+            cursor = await conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'"
+            )
+            if await cursor.fetchone() is not None:
+                self._fts_enabled = True
+            else:
+                self._fts_enabled = await self._init_fts(conn)
+            return
 
+        rebuilt = await self._migrate(conn)
+        cursor = await conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'job_tags'"
+        )
+        tags_existed = await cursor.fetchone() is not None
+        await conn.executescript(
+            _JOBS_TABLE
+            + """
             CREATE TABLE IF NOT EXISTS request_tracker (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 month TEXT NOT NULL,
@@ -65,207 +185,606 @@ class Database:
             CREATE TABLE IF NOT EXISTS cache_metadata (
                 key TEXT PRIMARY KEY,
                 value TEXT,
-                updated_at TEXT
+                updated_at INTEGER
             );
 
-            CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs(source);
-            CREATE INDEX IF NOT EXISTS idx_jobs_fetched_at ON jobs(fetched_at);
+            DROP INDEX IF EXISTS idx_jobs_source;
+            DROP INDEX IF EXISTS idx_jobs_fetched_at;
+            CREATE INDEX IF NOT EXISTS idx_jobs_active_src_fetched
+                ON jobs(is_active, source, fetched_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_jobs_active_fetched
+                ON jobs(is_active, fetched_at DESC);
             CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company);
+            CREATE INDEX IF NOT EXISTS idx_jobs_title_nc ON jobs(title COLLATE NOCASE);
+            CREATE INDEX IF NOT EXISTS idx_jobs_company_nc ON jobs(company COLLATE NOCASE);
+            CREATE INDEX IF NOT EXISTS idx_jobs_salary_min ON jobs(salary_min_k);
+
+            -- One row per (tag, job) so tag searches are index lookups rather
+            -- than LIKE scans over the JSON text in jobs.tags
+            CREATE TABLE IF NOT EXISTS job_tags (
+                tag TEXT NOT NULL COLLATE NOCASE,
+                job_id TEXT NOT NULL,
+                PRIMARY KEY (tag, job_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_job_tags_job ON job_tags(job_id);
+
+            CREATE TRIGGER IF NOT EXISTS jobs_tags_ai AFTER INSERT ON jobs BEGIN
+                INSERT OR IGNORE INTO job_tags (tag, job_id)
+                SELECT value, new.id FROM json_each(
+                    CASE WHEN json_valid(new.tags) THEN new.tags ELSE '[]' END
+                );
+            END;
+            CREATE TRIGGER IF NOT EXISTS jobs_tags_ad AFTER DELETE ON jobs BEGIN
+                DELETE FROM job_tags WHERE job_id = old.id;
+            END;
+            CREATE TRIGGER IF NOT EXISTS jobs_tags_au AFTER UPDATE OF id, tags ON jobs BEGIN
+                DELETE FROM job_tags WHERE job_id = old.id;
+                INSERT OR IGNORE INTO job_tags (tag, job_id)
+                SELECT value, new.id FROM json_each(
+                    CASE WHEN json_valid(new.tags) THEN new.tags ELSE '[]' END
+                );
+            END;
             """
         )
+        if not tags_existed:
+            await conn.execute(
+                """
+                INSERT OR IGNORE INTO job_tags (tag, job_id)
+                SELECT value, jobs.id FROM jobs, json_each(
+                    CASE WHEN json_valid(jobs.tags) THEN jobs.tags ELSE '[]' END
+                )
+                """
+            )
+        await conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         await conn.commit()
 
-    # === Job Operations ===
+        # Give the query planner statistics the first time the indexes exist
+        cursor = await conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+        )
+        if await cursor.fetchone() is None:
+            await conn.execute("ANALYZE")
+            await conn.commit()
+        self._fts_enabled = await self._init_fts(conn, rebuild=rebuilt)
 
-    async def save_job(self, job: JobPosting) -> None:
-        """Save a single job to the database."""
-        await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as conn:
-            await conn.execute(
+    async def _migrate(self, conn: aiosqlite.Connection) -> bool:
+        """Upgrade a jobs table created by an older schema version.
+
+        Returns:
+            True if the jobs table was rebuilt (its rowids have changed)
+        """
+        cursor = await conn.execute("PRAGMA user_version")
+        (version,) = await cursor.fetchone()
+        cursor = await conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs'"
+        )
+        if version >= SCHEMA_VERSION or await cursor.fetchone() is None:
+            return False
+
+        rebuilt = False
+        if version < 1:
+            # Version 1 stores posted_date/fetched_at as unix seconds instead of
+            # ISO strings. Column types cannot be altered in place, so copy the
+            # rows into a freshly created table.
+            await conn.executescript(
+                """
+                BEGIN;
+                DROP TRIGGER IF EXISTS jobs_fts_ai;
+                DROP TRIGGER IF EXISTS jobs_fts_ad;
+                DROP TRIGGER IF EXISTS jobs_fts_au;
+                ALTER TABLE jobs RENAME TO jobs_legacy;
+                """
+                + _JOBS_TABLE
+                + """
+                INSERT INTO jobs
+                    (id, title, company, location, salary_range, experience, education,
+                     description, requirements, tags, posted_date, url, source,
+                     fetched_at, is_active)
+                SELECT id, title, company, location, salary_range, experience, education,
+                       description, requirements, tags,
+                       CAST(strftime('%s', posted_date, 'utc') AS INTEGER),
+                       url, source,
+                       CAST(strftime('%s', fetched_at, 'utc') AS INTEGER),
+                       is_active
+                FROM jobs_legacy;
+                DROP TABLE jobs_legacy;
+                COMMIT;
+                """
+            )
+            rebuilt = True
+        else:
+            # Version 2 adds salary_min_k and version 3 exp_min/exp_max. The
+            # full-text update trigger is recreated by _init_fts limited to
+            # the indexed columns, so the backfill below doesn't reindex.
+            columns = ["exp_min INTEGER", "exp_max INTEGER"]
+            if version < 2:
+                columns.insert(0, "salary_min_k INTEGER")
+            await conn.executescript(
+                "BEGIN; DROP TRIGGER IF EXISTS jobs_fts_au;"
+                + "".join(f" ALTER TABLE jobs ADD COLUMN {column};" for column in columns)
+                + " COMMIT;"
+            )
+
+        # Fill in the parsed columns for rows saved before they existed
+        cursor = await conn.execute("SELECT id, salary_range, experience FROM jobs")
+        rows = await cursor.fetchall()
+        await conn.executemany(
+            "UPDATE jobs SET salary_min_k = ?, exp_min = ?, exp_max = ? WHERE id = ?",
+            [
+                (*_parsed_columns(salary_range, experience), job_id)
+                for job_id, salary_range, experience in rows
+            ],
+        )
+        await conn.commit()
+        return rebuilt
+
+    async def _init_fts(self, conn: aiosqlite.Connection, rebuild: bool = False) -> bool:
+        """Create the full-text index over jobs and the triggers that sync it.
+
+        Args:
+            conn: Open connection
+            rebuild: Reindex existing rows even if the index already exists
+
+        Returns:
+            True if full-text search is available
+        """
+        cursor = await conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'"
+        )
+        existed = await cursor.fetchone() is not None
+
+        # The trigram tokenizer gives substring matching, which keeps search
+        # working for CJK text that has no word boundaries.
+        try:
+            await conn.executescript(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                    title, company, description, tags,
+                    content='jobs', content_rowid='rowid', tokenize='trigram'
+                );
+
+                CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN
+                    INSERT INTO jobs_fts (rowid, title, company, description, tags)
+                    VALUES (new.rowid, new.title, new.company, new.description, new.tags);
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN
+                    INSERT INTO jobs_fts (jobs_fts, rowid, title, company, description, tags)
+                    VALUES ('delete', old.rowid, old.title, old.company, old.description, old.tags);
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS jobs_fts_au
+                AFTER UPDATE OF title, company, description, tags ON jobs BEGIN
+                    INSERT INTO jobs_fts (jobs_fts, rowid, title, company, description, tags)
+                    VALUES ('delete', old.rowid, old.title, old.company, old.description, old.tags);
+                    INSERT INTO jobs_fts (rowid, title, company, description, tags)
+                    VALUES (new.rowid, new.title, new.company, new.description, new.tags);
+                END;
                 """
-                INSERT OR REPLACE INTO jobs 
-                (id, title, company, location, salary_range, experience, education,
-                 description, requirements, tags, posted_date, url, source, fetched_at, is_active)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    job.id,
-                    job.title,
-                    job.company,
-                    job.location,
-                    job.salary_range,
-                    job.experience,
-                    job.education,
-                    job.description,
-                    json.dumps(job.requirements),
-                    json.dumps(job.tags),
-                    job.posted_date.isoformat() if job.posted_date else None,
-                    job.url,
-                    job.source,
-                    job.fetched_at.isoformat(),
-                    1 if job.is_active else 0,
-                ),
             )
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5 or the trigram tokenizer
+            return False
+
+        if rebuild or not existed:
+            # Index any jobs cached before the full-text table was added
+            await conn.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')")
             await conn.commit()
+        return True
+
+    # === Job Operations ===
+
+    async def save_job(self, job: JobPosting) -> None:
+        """Save a single job to the database."""
+        await self.save_jobs([job])
 
     async def save_jobs(self, jobs: list[JobPosting]) -> int:
         """Save multiple jobs to the database.
 
+        All rows are written with a single executemany inside one transaction.
+
         Args:
             jobs: List of jobs to save
 
         Returns:
             Number of jobs saved
         """
-        await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as conn:
-            for job in jobs:
-                await conn.execute(
-                    """
-                    INSERT OR REPLACE INTO jobs 
-                    (id, title, company, location, salary_range, experience, education,
-                     description, requirements, tags, posted_date, url, source, fetched_at, is_active)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        job.id,
-                        job.title,
-                        job.company,
-                        job.location,
-                        job.salary_range,
-                        job.experience,
-                        job.education,
-                        job.description,
-                        json.dumps(job.requirements),
-                        json.dumps(job.tags),
-                        job.posted_date.isoformat() if job.posted_date else None,
-                        job.url,
-                        job.source,
-                        job.fetched_at.isoformat(),
-                        1 if job.is_active else 0,
-                    ),
-                )
+        rows = [self._job_to_row(job) for job in jobs]
+        conn = await self._get_conn()
+        async with self._write_lock:
+            await conn.executemany(
+                """
+                INSERT OR REPLACE INTO jobs 
+                (id, title, company, location, salary_range, experience, education,
+                 description, requirements, tags, posted_date, url, source, fetched_at, is_active,
+                 salary_min_k, exp_min, exp_max)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
             await conn.commit()
-        return len(jobs)
+            self._query_cache.clear()
+        return len(rows)
 
     async def get_job(self, job_id: str) -> Optional[JobPosting]:
         """Get a single job by ID."""
-        await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as conn:
-            conn.row_factory = aiosqlite.Row
-            cursor = await conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
-            row = await cursor.fetchone()
-            if row:
-                return self._row_to_job(row)
+        conn = await self._get_conn()
+        cursor = await conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
+        row = await cursor.fetchone()
+        if row:
+            return self._row_to_job(row)
         return None
 
     async def get_jobs(
         self,
         source: Optional[str] = None,
         limit: int = 100,
-        offset: int = 0,
+        cursor: Optional[str] = None,
+        tech: Optional[list[str]] = None,
+        salary_min_k: Optional[int] = None,
+        exp_range: Optional[tuple[int, Optional[int]]] = None,
     ) -> list[JobPosting]:
-        """Get jobs from the database.
+        """Get jobs from the database, newest first.
 
         Args:
             source: Filter by source platform
             limit: Maximum number of jobs to return
-            offset: Offset for pagination
+            cursor: Keyset cursor from get_jobs_page; only jobs after it are
+                returned
+            tech: Only jobs matching any of these tech keywords
+            salary_min_k: Only jobs whose minimum salary is at least this (in k)
+            exp_range: Only jobs whose experience range overlaps this
+                (min, max) range; max is None for "N+". Jobs without a
+                parsable experience requirement always match.
 
         Returns:
             List of jobs
         """
-        await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as conn:
-            conn.row_factory = aiosqlite.Row
-            if source:
-                cursor = await conn.execute(
-                    "SELECT * FROM jobs WHERE source = ? AND is_active = 1 ORDER BY fetched_at DESC LIMIT ? OFFSET ?",
-                    (source, limit, offset),
-                )
-            else:
-                cursor = await conn.execute(
-                    "SELECT * FROM jobs WHERE is_active = 1 ORDER BY fetched_at DESC LIMIT ? OFFSET ?",
-                    (limit, offset),
-                )
-            rows = await cursor.fetchall()
-            return [self._row_to_job(row) for row in rows]
+        key = ("jobs", source, limit, cursor, tuple(tech or ()), salary_min_k, exp_range)
+        cached = self._cached_query(key)
+        if cached is not None:
+            return cached
+
+        sql, params = self._jobs_query(source, limit, cursor, tech, salary_min_k, exp_range)
+        conn = await self._get_conn()
+        rows = await (await conn.execute(sql, params)).fetchall()
+        return self._store_query(key, [self._row_to_job(row) for row in rows])
+
+    async def iter_jobs(
+        self,
+        source: Optional[str] = None,
+        limit: int = 100,
+        tech: Optional[list[str]] = None,
+        salary_min_k: Optional[int] = None,
+        exp_range: Optional[tuple[int, Optional[int]]] = None,
+    ) -> AsyncIterator[JobPosting]:
+        """Yield jobs newest first, reading rows from the cursor as needed.
+
+        Takes the same filters as get_jobs but never holds the whole result
+        in memory, for exports and other large reads.
+        """
+        sql, params = self._jobs_query(source, limit, None, tech, salary_min_k, exp_range)
+        conn = await self._get_conn()
+        async with conn.execute(sql, params) as rows:
+            async for row in rows:
+                yield self._row_to_job(row)
+
+    def _jobs_query(
+        self,
+        source: Optional[str],
+        limit: int,
+        cursor: Optional[str],
+        tech: Optional[list[str]],
+        salary_min_k: Optional[int],
+        exp_range: Optional[tuple[int, Optional[int]]],
+    ) -> tuple[str, list]:
+        """Build the SELECT used by get_jobs and iter_jobs."""
+        sql = "SELECT * FROM jobs WHERE is_active = 1"
+        params: list = []
+        if source:
+            sql += " AND source = ?"
+            params.append(source)
+        filter_sql, filter_params = self._filter_clauses(tech, salary_min_k, exp_range)
+        sql += filter_sql
+        params.extend(filter_params)
+        if cursor:
+            fetched_at, _, job_id = cursor.partition(":")
+            sql += " AND (fetched_at, id) < (?, ?)"
+            params.extend((int(fetched_at), job_id))
+        sql += " ORDER BY fetched_at DESC, id DESC LIMIT ?"
+        params.append(limit)
+        return sql, params
+
+    async def get_jobs_page(
+        self,
+        source: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        tech: Optional[list[str]] = None,
+        salary_min_k: Optional[int] = None,
+        exp_range: Optional[tuple[int, Optional[int]]] = None,
+    ) -> tuple[list[JobPosting], Optional[str]]:
+        """Get one page of jobs using keyset pagination.
+
+        Args:
+            source: Filter by source platform
+            limit: Maximum number of jobs to return
+            cursor: Cursor returned with the previous page, or None for the
+                first page
+            tech: Only jobs matching any of these tech keywords
+            salary_min_k: Only jobs whose minimum salary is at least this (in k)
+            exp_range: Only jobs whose experience range overlaps this
+                (min, max) range; max is None for "N+". Jobs without a
+                parsable experience requirement always match.
+
+        Returns:
+            Tuple of (jobs, next_cursor); next_cursor is None on the last page
+        """
+        jobs = await self.get_jobs(
+            source=source,
+            limit=limit,
+            cursor=cursor,
+            tech=tech,
+            salary_min_k=salary_min_k,
+            exp_range=exp_range,
+        )
+        if len(jobs) < limit:
+            return jobs, None
+        last = jobs[-1]
+        return jobs, f"{int(last.fetched_at.timestamp())}:{last.id}"
 
     async def search_jobs(
         self,
         query: str,
         source: Optional[str] = None,
         limit: int = 50,
+        offset: int = 0,
+        tech: Optional[list[str]] = None,
+        salary_min_k: Optional[int] = None,
+        exp_range: Optional[tuple[int, Optional[int]]] = None,
     ) -> list[JobPosting]:
-        """Search jobs by title, company, or description.
+        """Search jobs by title, company, description, or tags.
+
+        Uses the full-text index when available, ranking results by relevance.
+        Queries shorter than three characters cannot be matched by the trigram
+        index and fall back to LIKE ordered by recency: a prefix match on
+        title, company or a tag (served by the NOCASE indexes), or a substring
+        scan of all fields when the query starts with ``*`` or ``%``.
 
         Args:
             query: Search query
             source: Filter by source platform
             limit: Maximum results
+            offset: Number of leading results to skip, for paging through
+                them in the same order
+            tech: Only jobs matching any of these tech keywords
+            salary_min_k: Only jobs whose minimum salary is at least this (in k)
+            exp_range: Only jobs whose experience range overlaps this
+                (min, max) range; max is None for "N+". Jobs without a
+                parsable experience requirement always match.
 
         Returns:
             List of matching jobs
         """
-        await self._ensure_initialized()
-        search_pattern = f"%{query}%"
-        async with aiosqlite.connect(self.db_path) as conn:
-            conn.row_factory = aiosqlite.Row
+        key = ("search", query, source, limit, offset, tuple(tech or ()), salary_min_k, exp_range)
+        cached = self._cached_query(key)
+        if cached is not None:
+            return cached
+
+        filter_sql, filter_params = self._filter_clauses(tech, salary_min_k, exp_range)
+        substring = query[:1] in ("*", "%")
+        query = query.lstrip("*%")
+        conn = await self._get_conn()
+        if self._fts_enabled and len(query) >= 3:
+            # Quote the query as a single FTS phrase so user input is never
+            # parsed as FTS syntax
+            match = '"' + query.replace('"', '""') + '"'
+            sql = """
+                SELECT jobs.* FROM jobs_fts
+                JOIN jobs ON jobs.rowid = jobs_fts.rowid
+                WHERE jobs_fts MATCH ? AND jobs.is_active = 1
+                """
+            params: list = [match]
             if source:
-                cursor = await conn.execute(
-                    """
-                    SELECT * FROM jobs 
-                    WHERE is_active = 1 AND source = ?
-                    AND (title LIKE ? OR company LIKE ? OR description LIKE ? OR tags LIKE ?)
-                    ORDER BY fetched_at DESC LIMIT ?
-                    """,
-                    (source, search_pattern, search_pattern, search_pattern, search_pattern, limit),
+                sql += " AND jobs.source = ?"
+                params.append(source)
+            sql += filter_sql
+            params.extend(filter_params)
+            sql += " ORDER BY bm25(jobs_fts) LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
+            cursor = await conn.execute(sql, params)
+            rows = await cursor.fetchall()
+            return self._store_query(key, [self._row_to_job(row) for row in rows])
+
+        sql = "SELECT * FROM jobs WHERE is_active = 1"
+        params = []
+        if source:
+            sql += " AND source = ?"
+            params.append(source)
+        if substring:
+            search_pattern = f"%{query}%"
+            sql += (
+                " AND (title LIKE ? OR company LIKE ? OR description LIKE ?"
+                " OR id IN (SELECT job_id FROM job_tags WHERE tag LIKE ?))"
+            )
+            params.extend([search_pattern] * 4)
+        else:
+            escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            prefix_pattern = f"{escaped}%"
+            sql += (
+                " AND (title LIKE ? ESCAPE '\\' OR company LIKE ? ESCAPE '\\'"
+                " OR id IN (SELECT job_id FROM job_tags WHERE tag LIKE ? ESCAPE '\\'))"
+            )
+            params.extend([prefix_pattern] * 3)
+        sql += filter_sql
+        params.extend(filter_params)
+        sql += " ORDER BY fetched_at DESC LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+
+        cursor = await conn.execute(sql, params)
+        rows = await cursor.fetchall()
+        return self._store_query(key, [self._row_to_job(row) for row in rows])
+
+    def _cached_query(self, key: tuple) -> Optional[list[JobPosting]]:
+        """Return a copy of a cached, unexpired query result, if any."""
+        entry = self._query_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, jobs = entry
+        if time.monotonic() >= expires_at:
+            del self._query_cache[key]
+            return None
+        return list(jobs)
+
+    def _store_query(self, key: tuple, jobs: list[JobPosting]) -> list[JobPosting]:
+        """Cache a query result if the query cache is enabled.
+
+        Callers get their own list, so changing it doesn't affect the cache.
+        """
+        if self.query_cache_ttl <= 0:
+            return jobs
+        if len(self._query_cache) >= _QUERY_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del self._query_cache[next(iter(self._query_cache))]
+        self._query_cache[key] = (time.monotonic() + self.query_cache_ttl, jobs)
+        return list(jobs)
+
+    @staticmethod
+    def _filter_clauses(
+        tech: Optional[list[str]],
+        salary_min_k: Optional[int],
+        exp_range: Optional[tuple[int, Optional[int]]] = None,
+    ) -> tuple[str, list]:
+        """Build the WHERE conditions shared by the job queries.
+
+        A tech keyword matches a job with that tag (case-insensitive) or with
+        the keyword anywhere in its title or description; a job matches if
+        any keyword does.
+
+        Args:
+            tech: Lowercase tech keywords, or None for no tech filter
+            salary_min_k: Minimum salary in k, or None for no salary filter
+            exp_range: (min, max) years of experience, or None for no
+                experience filter
+
+        Returns:
+            Tuple of (SQL fragment starting with " AND", parameters)
+        """
+        sql = ""
+        params: list = []
+        if tech:
+            clauses = []
+            for keyword in tech:
+                escaped = keyword.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                pattern = f"%{escaped}%"
+                clauses.append(
+                    "jobs.id IN (SELECT job_id FROM job_tags WHERE tag = ?)"
+                    " OR jobs.title LIKE ? ESCAPE '\\' OR jobs.description LIKE ? ESCAPE '\\'"
                 )
+                params.extend((keyword, pattern, pattern))
+            sql += " AND (" + " OR ".join(clauses) + ")"
+        if salary_min_k is not None:
+            sql += " AND jobs.salary_min_k >= ?"
+            params.append(salary_min_k)
+        if exp_range:
+            # exp_max is NULL both for "N+" jobs and (with exp_min) for jobs
+            # whose experience couldn't be parsed, which always match
+            req_min, req_max = exp_range
+            if req_max is None:
+                sql += " AND (jobs.exp_max IS NULL OR jobs.exp_max >= ?)"
+                params.append(req_min)
             else:
-                cursor = await conn.execute(
-                    """
-                    SELECT * FROM jobs 
-                    WHERE is_active = 1
-                    AND (title LIKE ? OR company LIKE ? OR description LIKE ? OR tags LIKE ?)
-                    ORDER BY fetched_at DESC LIMIT ?
-                    """,
-                    (search_pattern, search_pattern, search_pattern, search_pattern, limit),
+                sql += (
+                    " AND (jobs.exp_min IS NULL OR (jobs.exp_min <= ?"
+                    " AND (jobs.exp_max IS NULL OR jobs.exp_max >= ?)))"
                 )
-            rows = await cursor.fetchall()
-            return [self._row_to_job(row) for row in rows]
+                params.extend((req_max, req_min))
+        return sql, params
 
-    async def delete_old_jobs(self, days: int = 30) -> int:
+    async def delete_old_jobs(self, days: int = 30, hard: bool = False) -> int:
         """Delete jobs older than specified days.
 
+        By default jobs are soft-deleted (marked inactive), which is cheap and
+        idempotent; compact() later removes them for good.
+
         Args:
             days: Delete jobs older than this many days
+            hard: Remove the rows immediately instead of marking them inactive
 
         Returns:
             Number of jobs deleted
         """
-        await self._ensure_initialized()
-        cutoff = datetime.now().isoformat()
-        async with aiosqlite.connect(self.db_path) as conn:
-            cursor = await conn.execute(
-                "DELETE FROM jobs WHERE fetched_at < date(?, '-' || ? || ' days')",
-                (cutoff, days),
-            )
+        cutoff = int(time.time()) - days * 86400
+        if hard:
+            sql = "DELETE FROM jobs WHERE fetched_at < ?"
+        else:
+            sql = "UPDATE jobs SET is_active = 0 WHERE fetched_at < ? AND is_active = 1"
+        conn = await self._get_conn()
+        async with self._write_lock:
+            cursor = await conn.execute(sql, (cutoff,))
             await conn.commit()
+            self._query_cache.clear()
             return cursor.rowcount
 
+    async def compact(self) -> int:
+        """Remove soft-deleted jobs and return freed pages to the filesystem.
+
+        Returns:
+            Number of jobs removed
+        """
+        conn = await self._get_conn()
+        async with self._write_lock:
+            cursor = await conn.execute("DELETE FROM jobs WHERE is_active = 0")
+            await conn.commit()
+            self._query_cache.clear()
+            removed = cursor.rowcount
+            # Each step of the pragma frees one page, so drain it fully
+            cursor = await conn.execute("PRAGMA incremental_vacuum")
+            await cursor.fetchall()
+            await conn.commit()
+        return removed
+
     async def get_job_count(self, source: Optional[str] = None) -> int:
         """Get total number of jobs in cache."""
-        await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as conn:
-            if source:
-                cursor = await conn.execute(
-                    "SELECT COUNT(*) FROM jobs WHERE source = ? AND is_active = 1",
-                    (source,),
-                )
-            else:
-                cursor = await conn.execute("SELECT COUNT(*) FROM jobs WHERE is_active = 1")
-            row = await cursor.fetchone()
-            return row[0] if row else 0
+        conn = await self._get_conn()
+        if source:
+            cursor = await conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE source = ? AND is_active = 1",
+                (source,),
+            )
+        else:
+            cursor = await conn.execute("SELECT COUNT(*) FROM jobs WHERE is_active = 1")
+        row = await cursor.fetchone()
+        return row[0] if row else 0
+
+    async def get_job_counts_by_source(self) -> dict[str, int]:
+        """Get the number of cached jobs for every source in one query."""
+        conn = await self._get_conn()
+        cursor = await conn.execute(
+            "SELECT source, COUNT(*) FROM jobs WHERE is_active = 1 GROUP BY source"
+        )
+        return {source: count for source, count in await cursor.fetchall()}
+
+    def _job_to_row(self, job: JobPosting) -> tuple:
+        """Convert a JobPosting object to a tuple of insert parameters."""
+        return (
+            job.id,
+            job.title,
+            job.company,
+            job.location,
+            job.salary_range,
+            job.experience,
+            job.education,
+            job.description,
+            orjson.dumps(job.requirements).decode(),
+            orjson.dumps(job.tags).decode(),
+            int(job.posted_date.timestamp()) if job.posted_date else None,
+            job.url,
+            job.source,
+            int(job.fetched_at.timestamp()),
+            1 if job.is_active else 0,
+            *_parsed_columns(job.salary_range, job.experience),
+        )
 
     def _row_to_job(self, row: aiosqlite.Row) -> JobPosting:
         """Convert a database row to a JobPosting object."""
@@ -278,17 +797,29 @@ class Database:
             experience=row["experience"],
             education=row["education"],
             description=row["description"],
-            requirements=json.loads(row["requirements"]) if row["requirements"] else [],
-            tags=json.loads(row["tags"]) if row["tags"] else [],
-            posted_date=datetime.fromisoformat(row["posted_date"]) if row["posted_date"] else None,
+            requirements=orjson.loads(row["requirements"]) if row["requirements"] else [],
+            tags=orjson.loads(row["tags"]) if row["tags"] else [],
+            posted_date=datetime.fromtimestamp(row["posted_date"]) if row["posted_date"] else None,
             url=row["url"],
             source=row["source"],
-            fetched_at=datetime.fromisoformat(row["fetched_at"]),
+            fetched_at=datetime.fromtimestamp(row["fetched_at"]),
             is_active=bool(row["is_active"]),
+            salary_min_k=row["salary_min_k"],
+            exp_min=row["exp_min"],
+            exp_max=row["exp_max"],
         )
 
     # === Request Tracking ===
 
+    def _current_month(self) -> str:
+        """Get the current month as YYYY-MM, recomputed at most once a minute."""
+        now = time.time()
+        expires_at, month = self._month_cache
+        if now >= expires_at:
+            month = time.strftime("%Y-%m", time.localtime(now))
+            self._month_cache = (now + 60, month)
+        return month
+
     async def increment_request_count(self, count: int = 1) -> int:
         """Increment the request counter for the current month.
 
@@ -298,9 +829,25 @@ class Database:
         Returns:
             New total for the month
         """
-        await self._ensure_initialized()
-        month = datetime.now().strftime("%Y-%m")
-        async with aiosqlite.connect(self.db_path) as conn:
+        month = self._current_month()
+        conn = await self._get_conn()
+        async with self._write_lock:
+            if _HAS_RETURNING:
+                cursor = await conn.execute(
+                    """
+                    INSERT INTO request_tracker (month, requests_count)
+                    VALUES (?, ?)
+                    ON CONFLICT(month) DO UPDATE SET requests_count = requests_count + ?
+                    RETURNING requests_count
+                    """,
+                    (month, count, count),
+                )
+                row = await cursor.fetchone()
+                await conn.commit()
+                total = row[0] if row else count
+                self._usage_cache = (month, total, time.monotonic() + _USAGE_CACHE_TTL)
+                return total
+
             await conn.execute(
                 """
                 INSERT INTO request_tracker (month, requests_count)
@@ -315,51 +862,81 @@ class Database:
                 (month,),
             )
             row = await cursor.fetchone()
-            return row[0] if row else count
+            total = row[0] if row else count
+            self._usage_cache = (month, total, time.monotonic() + _USAGE_CACHE_TTL)
+            return total
 
     async def get_monthly_usage(self) -> RequestStats:
         """Get request usage statistics for the current month."""
-        await self._ensure_initialized()
-        month = datetime.now().strftime("%Y-%m")
-        settings = get_settings()
-        async with aiosqlite.connect(self.db_path) as conn:
+        month = self._current_month()
+        cached = self._usage_cache
+        if cached is not None and cached[0] == month and time.monotonic() < cached[2]:
+            requests_used = cached[1]
+        else:
+            conn = await self._get_conn()
             cursor = await conn.execute(
                 "SELECT requests_count FROM request_tracker WHERE month = ?",
                 (month,),
             )
             row = await cursor.fetchone()
             requests_used = row[0] if row else 0
-            return RequestStats(
-                month=month,
-                requests_used=requests_used,
-                monthly_limit=settings.monthly_request_limit,
-            )
+            self._usage_cache = (month, requests_used, time.monotonic() + _USAGE_CACHE_TTL)
+        return RequestStats(
+            month=month,
+            requests_used=requests_used,
+            monthly_limit=self.monthly_request_limit,
+        )
 
     # === Cache Metadata ===
 
     async def set_metadata(self, key: str, value: str) -> None:
-        """Set a cache metadata value."""
-        await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as conn:
-            await conn.execute(
-                """
-                INSERT OR REPLACE INTO cache_metadata (key, value, updated_at)
-                VALUES (?, ?, ?)
-                """,
-                (key, value, datetime.now().isoformat()),
-            )
-            await conn.commit()
+        """Set a cache metadata value.
+
+        Writes are coalesced: they are visible to get_metadata immediately
+        and committed together shortly after, or when the database closes.
+        """
+        self._pending_meta[key] = (value, int(time.time()))
+        if self._meta_flush_task is None:
+            self._meta_flush_task = asyncio.create_task(self._flush_meta_later())
+
+    async def _flush_meta_later(self, delay: float = 0.1) -> None:
+        """Flush pending metadata after a short debounce window."""
+        await asyncio.sleep(delay)
+        self._meta_flush_task = None
+        await self._flush_meta()
+
+    async def _flush_meta(self) -> None:
+        """Write all pending metadata in one transaction."""
+        if not self._pending_meta:
+            return
+        conn = await self._get_conn()
+        async with self._write_lock:
+            pending, self._pending_meta = self._pending_meta, {}
+            try:
+                await conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO cache_metadata (key, value, updated_at)
+                    VALUES (?, ?, ?)
+                    """,
+                    [(key, value, updated_at) for key, (value, updated_at) in pending.items()],
+                )
+                await conn.commit()
+            except BaseException:
+                # Keep unwritten values (and any newer ones) for the next flush
+                self._pending_meta = {**pending, **self._pending_meta}
+                raise
 
     async def get_metadata(self, key: str) -> Optional[str]:
         """Get a cache metadata value."""
-        await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as conn:
-            cursor = await conn.execute(
-                "SELECT value FROM cache_metadata WHERE key = ?",
-                (key,),
-            )
-            row = await cursor.fetchone()
-            return row[0] if row else None
+        if key in self._pending_meta:
+            return self._pending_meta[key][0]
+        conn = await self._get_conn()
+        cursor = await conn.execute(
+            "SELECT value FROM cache_metadata WHERE key = ?",
+            (key,),
+        )
+        row = await cursor.fetchone()
+        return row[0] if row else None
 
     async def get_last_refresh(self, source: str) -> Optional[datetime]:
         """Get the last refresh time for a source."""
@@ -368,6 +945,24 @@ class Database:
             return datetime.fromisoformat(value)
         return None
 
+    async def get_last_refresh_all(self) -> dict[str, datetime]:
+        """Get the last refresh time of every source that has one."""
+        prefix = "last_refresh_"
+        conn = await self._get_conn()
+        cursor = await conn.execute(
+            "SELECT key, value FROM cache_metadata WHERE key LIKE ? ESCAPE '\\'",
+            (prefix.replace("_", "\\_") + "%",),
+        )
+        values = {key: value for key, value in await cursor.fetchall()}
+        values.update(
+            (key, value) for key, (value, _) in self._pending_meta.items() if key.startswith(prefix)
+        )
+        return {
+            key[len(prefix):]: datetime.fromisoformat(value)
+            for key, value in values.items()
+            if value
+        }
+
     async def set_last_refresh(self, source: str) -> None:
         """Set the last refresh time for a source to now."""
         await self.set_metadata(f"last_refresh_{source}", datetime.now().isoformat())
@@ -382,8 +977,7 @@ class Database:
         Returns:
             True if cache is stale or doesn't exist
         """
-        settings = get_settings()
-        hours = hours or settings.cache_expiry_hours
+        hours = hours or self.cache_expiry_hours
         last_refresh = await self.get_last_refresh(source)
         if not last_refresh:
             return True
@@ -2,11 +2,19 @@
 
 import asyncio
 import logging
+from contextlib import AsyncExitStack
 from typing import Optional, Any
 
+import anyio
+import httpx
 from mcp import ClientSession
 from mcp.client.sse import sse_client
-from mcp.types import TextContent
+from mcp.types import CONNECTION_CLOSED, TextContent
+
+try:
+    from mcp.shared.exceptions import McpError
+except ImportError:  # Renamed in mcp 2
+    from mcp.shared.exceptions import MCPError as McpError
 
 from ..config import get_settings
 
@@ -15,6 +23,36 @@ logging.getLogger("root").setLevel(logging.ERROR)
 
 logger = logging.getLogger(__name__)
 
+# Transport-level failures worth retrying; anything else is raised immediately.
+# httpx.TransportError covers ReadTimeout, ConnectError and RemoteProtocolError;
+# the anyio errors come from writing to a stream the server already closed.
+RETRYABLE_EXCEPTIONS = (
+    asyncio.TimeoutError,
+    ConnectionError,
+    OSError,
+    httpx.TransportError,
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+)
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """Check if an error is a transport failure worth retrying.
+
+    A session whose stream was closed under it fails with an MCP error
+    rather than a transport one, so that is retried as well.
+    """
+    if isinstance(error, McpError):
+        return error.error.code == CONNECTION_CLOSED
+    return isinstance(error, RETRYABLE_EXCEPTIONS)
+
+
+async def _backoff(attempt: int, max_retries: int, base_delay: float, error: Exception) -> None:
+    """Sleep with exponential backoff before the next retry."""
+    delay = base_delay * (2 ** attempt)
+    logger.warning(f"MCP error (attempt {attempt + 1}/{max_retries + 1}): {error}, retrying in {delay:.1f}s...")
+    await asyncio.sleep(delay)
+
 
 class MCPConnectionError(Exception):
     """Raised when MCP connection fails after retries."""
@@ -46,10 +84,78 @@ class BrightDataMCP:
                 "Set BRIGHT_DATA_API_TOKEN environment variable or pass api_token parameter."
             )
 
+        self._url = f"{self.base_url}?token={self.api_token}"
+        self._stack: Optional[AsyncExitStack] = None
+        self._session: Optional[ClientSession] = None
+
     @property
     def url(self) -> str:
         """Get the full MCP URL with token."""
-        return f"{self.base_url}?token={self.api_token}"
+        return self._url
+
+    @property
+    def connected(self) -> bool:
+        """Whether a shared session is open for calls to reuse."""
+        return self._session is not None
+
+    async def __aenter__(self) -> "BrightDataMCP":
+        """Open one SSE connection and MCP session shared by all calls.
+
+        If the handshake fails, calls fall back to opening a connection
+        per call (with the usual retries) instead of failing here.
+        """
+        stack = AsyncExitStack()
+        try:
+            read, write = await stack.enter_async_context(sse_client(self.url))
+            session = await stack.enter_async_context(ClientSession(read, write))
+            await session.initialize()
+        except Exception as e:
+            logger.warning(f"MCP session setup failed, using per-call connections: {e}")
+            await stack.aclose()
+            return self
+        self._stack = stack
+        self._session = session
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the shared MCP session."""
+        stack, self._stack, self._session = self._stack, None, None
+        if stack is not None:
+            try:
+                await stack.aclose()
+            except Exception as e:
+                logger.debug(f"Error closing MCP session: {e}")
+
+    @staticmethod
+    async def _invoke(session: ClientSession, tool_name: str, arguments: dict[str, Any]) -> str:
+        """Call a tool on an initialized session and extract its text."""
+        result = await session.call_tool(tool_name, arguments)
+
+        # Extract text content from result
+        if result.content and len(result.content) > 0:
+            content = result.content[0]
+            if isinstance(content, TextContent):
+                return content.text
+            # Handle other content types if needed
+            return str(content)
+
+        return ""
+
+    async def _call_once(self, tool_name: str, arguments: dict[str, Any]) -> str:
+        """Call a tool once, on the shared session if one is open."""
+        session = self._session
+        if session is not None:
+            try:
+                return await self._invoke(session, tool_name, arguments)
+            except Exception:
+                # The shared stream may be broken; retries open their own
+                self._session = None
+                raise
+
+        async with sse_client(self.url) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                return await self._invoke(session, tool_name, arguments)
 
     async def _call_tool(
         self,
@@ -76,50 +182,24 @@ class BrightDataMCP:
 
         for attempt in range(max_retries + 1):
             try:
-                async with sse_client(self.url) as (read, write):
-                    async with ClientSession(read, write) as session:
-                        await session.initialize()
-
-                        result = await session.call_tool(tool_name, arguments)
-
-                        # Extract text content from result
-                        if result.content and len(result.content) > 0:
-                            content = result.content[0]
-                            if isinstance(content, TextContent):
-                                return content.text
-                            # Handle other content types if needed
-                            return str(content)
+                return await self._call_once(tool_name, arguments)
 
-                        return ""
+            except RETRYABLE_EXCEPTIONS as e:
+                last_error = e
 
-            except asyncio.TimeoutError as e:
+            except McpError as e:
+                if not _is_retryable(e):
+                    raise
                 last_error = e
-                if attempt < max_retries:
-                    delay = base_delay * (2 ** attempt)  # Exponential backoff
-                    logger.warning(f"MCP timeout (attempt {attempt + 1}/{max_retries + 1}), retrying in {delay:.1f}s...")
-                    await asyncio.sleep(delay)
-                continue
 
-            except ConnectionError as e:
+            except ExceptionGroup as e:
+                # Task groups inside sse_client wrap transport errors
+                if e.split(_is_retryable)[1] is not None:
+                    raise
                 last_error = e
-                if attempt < max_retries:
-                    delay = base_delay * (2 ** attempt)
-                    logger.warning(f"MCP connection error (attempt {attempt + 1}/{max_retries + 1}), retrying in {delay:.1f}s...")
-                    await asyncio.sleep(delay)
-                continue
 
-            except Exception as e:
-                # For other errors, check if it's retryable
-                error_str = str(e).lower()
-                if "timeout" in error_str or "connection" in error_str or "network" in error_str:
-                    last_error = e
-                    if attempt < max_retries:
-                        delay = base_delay * (2 ** attempt)
-                        logger.warning(f"MCP error (attempt {attempt + 1}/{max_retries + 1}): {e}, retrying in {delay:.1f}s...")
-                        await asyncio.sleep(delay)
-                    continue
-                # Non-retryable error, raise immediately
-                raise
+            if attempt < max_retries:
+                await _backoff(attempt, max_retries, base_delay, last_error)
 
         # All retries exhausted
         raise MCPConnectionError(
@@ -139,6 +219,34 @@ class BrightDataMCP:
         """
         return await self._call_tool("scrape_as_markdown", {"url": url})
 
+    async def scrape_many(
+        self,
+        urls: list[str],
+        concurrency: int = 8,
+    ) -> list[str | BaseException]:
+        """Scrape several URLs concurrently.
+
+        Requests are multiplexed over the shared session when the client is
+        used as a context manager. Rate limits are not checked here; callers
+        should check the monthly budget once for the whole batch and record
+        it with a single ``increment_request_count(len(urls))``.
+
+        Args:
+            urls: URLs to scrape
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            Markdown for each URL in input order, or the exception raised
+            for that URL
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(url: str) -> str:
+            async with sem:
+                return await self.scrape_as_markdown(url)
+
+        return await asyncio.gather(*(one(u) for u in urls), return_exceptions=True)
+
     async def search_engine(self, query: str, num_results: int = 10) -> str:
         """Perform a web search and return results.
 
@@ -160,6 +268,10 @@ class BrightDataMCP:
         Returns:
             List of tool names available on the server
         """
+        if self._session is not None:
+            tools = await self._session.list_tools()
+            return [tool.name for tool in tools.tools]
+
         async with sse_client(self.url) as (read, write):
             async with ClientSession(read, write) as session:
                 await session.initialize()
@@ -1,5 +1,6 @@
 """Configuration management using pydantic-settings."""
 
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -14,6 +15,7 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        frozen=True,
     )
 
     # Bright Data MCP settings
@@ -60,12 +62,12 @@ class Settings(BaseSettings):
         description="List of enabled scraper names",
     )
 
-    @property
+    @cached_property
     def database_path(self) -> Path:
         """Get the SQLite database path."""
         return self.cache_dir / "jobs.db"
 
-    @property
+    @cached_property
     def mcp_url_with_token(self) -> str:
         """Get the full MCP URL with token."""
         return f"{self.bright_data_mcp_url}?token={self.bright_data_api_token}"
@@ -75,19 +77,13 @@ class Settings(BaseSettings):
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
 
-# Global settings instance
-_settings: Optional[Settings] = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get the global settings instance."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    """Get the global settings instance, creating the cache directory once."""
+    settings = Settings()
+    settings.ensure_cache_dir()
+    return settings
 
 
-def reset_settings() -> None:
-    """Reset settings (useful for testing)."""
-    global _settings
-    _settings = None
+# Reset settings (useful for testing)
+reset_settings = get_settings.cache_clear
@@ -1,16 +1,82 @@
 """Rich terminal UI components for displaying job information."""
 
+import copy
+from bisect import bisect_right
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from io import StringIO
+from operator import attrgetter
+from typing import TYPE_CHECKING, Optional
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 from rich.text import Text
 
 from ..models import JobPosting, RequestStats
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console, RenderableType
+    from rich.table import Table
+
+
+# The rest of rich (console, table, panel) is imported on first use so that
+# importing this module stays cheap for code paths that never render.
+@lru_cache(maxsize=1)
+def _get_console() -> "Console":
+    """Get the shared console, creating it on first use."""
+    from rich.console import Console
+
+    return Console(highlight=False)
+
+
+_ELLIPSIS = "..."
+
+# Max widths of the truncated title, company and location columns
+_COL_WIDTHS = (30, 20, 15)
+_get_title = attrgetter("title")
+_get_company = attrgetter("company")
+_get_location = attrgetter("location")
+_get_source = attrgetter("source")
+
+# Static labels for display_job_detail, styled once instead of parsed as markup
+_LABEL_LOCATION = Text.assemble(("Location:", "blue"), "  ")
+_LABEL_SALARY = Text.assemble(("Salary:", "yellow"), "   ")
+_LABEL_EXPERIENCE = Text.assemble(("Experience:", "cyan"), " ")
+_LABEL_EDUCATION = Text.assemble(("Education:", "cyan"), "  ")
+_LABEL_POSTED = Text.assemble(("Posted:", "dim"), "    ")
+_LABEL_SOURCE = Text.assemble(("Source:", "magenta"), "    ")
+_LABEL_TAGS = Text.assemble(("Tech Stack:", "bold"), "\n  ")
+_LABEL_DESCRIPTION = Text.assemble(("Description:", "bold"), "\n  ")
+_LABEL_REQUIREMENTS = Text("Requirements:", style="bold")
+
+
+def _render(*renderables: "RenderableType") -> None:
+    """Render several renderables to one string and write it in one go."""
+    from rich.console import Group
+
+    console = _get_console()
+    with console.capture() as capture:
+        console.print(Group(*renderables))
+    console.file.write(capture.get())
+    console.file.flush()
+
+
+@lru_cache(maxsize=2)
+def _jobs_table_template(show_source: bool) -> "Table":
+    """Build the column layout for display_jobs_table once per variant.
+
+    Callers must clone it (including its columns) before adding rows.
+    """
+    from rich.table import Table
+
+    table = Table(show_header=True, header_style="bold cyan")
+
+    table.add_column("#", style="dim", width=4)
+    table.add_column("Title", style="white", max_width=30)
+    table.add_column("Company", style="green", max_width=20)
+    table.add_column("Location", style="blue", max_width=15)
+    table.add_column("Salary (RMB)", style="yellow", max_width=14)
+    if show_source:
+        table.add_column("Source", style="magenta", max_width=12)
+    return table
 
 
 def display_jobs_table(
@@ -26,35 +92,44 @@ def display_jobs_table(
         show_source: Whether to show the source column
     """
     if not jobs:
-        console.print("[yellow]No jobs found.[/yellow]")
+        _get_console().print("[yellow]No jobs found.[/yellow]")
         return
 
-    table = Table(title=title, show_header=True, header_style="bold cyan")
+    if not _get_console().is_terminal:
+        _plain_display_jobs_table(jobs, show_source)
+        return
 
-    table.add_column("#", style="dim", width=4)
-    table.add_column("Title", style="white", max_width=30)
-    table.add_column("Company", style="green", max_width=20)
-    table.add_column("Location", style="blue", max_width=15)
-    table.add_column("Salary (RMB)", style="yellow", max_width=14)
-    if show_source:
-        table.add_column("Source", style="magenta", max_width=12)
+    template = _jobs_table_template(show_source)
+    table = copy.copy(template)
+    table.columns = [column.copy() for column in template.columns]
+    table.rows = []
+    table.title = title
+
+    # Truncate column by column rather than calling _truncate per cell
+    title_w, company_w, location_w = _COL_WIDTHS
+    titles = [t if len(t) <= title_w else t[: title_w - 3] + "..." for t in map(_get_title, jobs)]
+    companies = [c if len(c) <= company_w else c[: company_w - 3] + "..." for c in map(_get_company, jobs)]
+    locations = [
+        l if len(l) <= location_w else l[: location_w - 3] + "..."
+        for l in map(_get_location, jobs)
+    ]
+    # Format salary with currency indicator
+    salaries = [f"¥{j.salary_range}" if j.salary_range else "-" for j in jobs]
+    numbers = map(str, range(1, len(jobs) + 1))
 
-    for i, job in enumerate(jobs, 1):
-        # Format salary with currency indicator
-        salary_display = f"¥{job.salary_range}" if job.salary_range else "-"
-        row = [
-            str(i),
-            _truncate(job.title, 30),
-            _truncate(job.company, 20),
-            _truncate(job.location, 15),
-            salary_display,
-        ]
-        if show_source:
-            row.append(job.source)
-        table.add_row(*row)
+    # Branch on show_source once, outside the row loop
+    if show_source:
+        sources = list(map(_get_source, jobs))
+        for row in zip(numbers, titles, companies, locations, salaries, sources):
+            table.add_row(*row)
+    else:
+        for row in zip(numbers, titles, companies, locations, salaries):
+            table.add_row(*row)
 
-    console.print(table)
-    console.print(f"\n[dim]Showing {len(jobs)} jobs. Use 'jobs-cli show <#>' to view details.[/dim]")
+    _render(
+        table,
+        Text.from_markup(f"\n[dim]Showing {len(jobs)} jobs. Use 'jobs-cli show <#>' to view details.[/dim]"),
+    )
 
 
 def display_job_detail(job: JobPosting) -> None:
@@ -63,63 +138,66 @@ def display_job_detail(job: JobPosting) -> None:
     Args:
         job: The job to display
     """
-    # Header
-    title_text = Text(job.title, style="bold white")
-    company_text = Text(f" @ {job.company}", style="green")
+    if not _get_console().is_terminal:
+        _plain_display_job_detail(job)
+        return
 
-    header = Text()
-    header.append_text(title_text)
-    header.append_text(company_text)
+    from rich.console import Group
+    from rich.panel import Panel
+
+    # Header
+    header = Text.assemble((job.title, "bold white"), (f" @ {job.company}", "green"))
 
     # Build content sections
-    content_parts = []
+    content_parts: list[Text] = []
 
     # Basic info
-    content_parts.append(f"[blue]Location:[/blue]  {job.location}")
+    content_parts.append(_labelled(_LABEL_LOCATION, job.location))
     if job.salary_range:
-        content_parts.append(f"[yellow]Salary:[/yellow]   ¥{job.salary_range}/month")
+        content_parts.append(_labelled(_LABEL_SALARY, f"¥{job.salary_range}/month"))
     if job.experience:
-        content_parts.append(f"[cyan]Experience:[/cyan] {job.experience}")
+        content_parts.append(_labelled(_LABEL_EXPERIENCE, job.experience))
     if job.education:
-        content_parts.append(f"[cyan]Education:[/cyan]  {job.education}")
+        content_parts.append(_labelled(_LABEL_EDUCATION, job.education))
 
     # Posted date
     if job.posted_date:
         age = _format_relative_date(job.posted_date)
-        content_parts.append(f"[dim]Posted:[/dim]    {age}")
+        content_parts.append(_labelled(_LABEL_POSTED, age))
 
-    content_parts.append(f"[magenta]Source:[/magenta]    {job.source}")
-    content_parts.append("")
+    content_parts.append(_labelled(_LABEL_SOURCE, job.source))
+    content_parts.append(Text())
 
     # Tags
     if job.tags:
-        tags_str = " ".join(f"[{tag}]" for tag in job.tags[:10])
-        content_parts.append(f"[bold]Tech Stack:[/bold]\n  {tags_str}")
-        content_parts.append("")
+        tags_slice = job.tags[:10]
+        tags_str = " ".join(["[" + tag + "]" for tag in tags_slice])
+        content_parts.append(_labelled(_LABEL_TAGS, tags_str))
+        content_parts.append(Text())
 
     # Description
     if job.description:
         desc = _truncate(job.description, 500)
-        content_parts.append(f"[bold]Description:[/bold]\n  {desc}")
-        content_parts.append("")
+        content_parts.append(_labelled(_LABEL_DESCRIPTION, desc))
+        content_parts.append(Text())
 
     # Requirements
     if job.requirements:
-        content_parts.append("[bold]Requirements:[/bold]")
+        content_parts.append(_LABEL_REQUIREMENTS)
         for req in job.requirements[:8]:
-            content_parts.append(f"  • {_truncate(req, 70)}")
-        content_parts.append("")
+            content_parts.append(Text(f"  • {_truncate(req, 70)}"))
+        content_parts.append(Text())
 
     # URL
-    content_parts.append(f"[dim]URL: {job.url}[/dim]")
+    content_parts.append(Text(f"URL: {job.url}", style="dim"))
 
     panel = Panel(
-        "\n".join(content_parts),
+        Group(*content_parts),
         title=header,
         border_style="cyan",
         padding=(1, 2),
     )
-    console.print(panel)
+    _get_console().print(panel)
 
 
 def display_stats(
@@ -134,26 +212,32 @@ def display_stats(
         job_counts: Dictionary of job counts per source
         last_refresh: Dictionary of last refresh times per source
     """
+    if not _get_console().is_terminal:
+        _plain_display_stats(request_stats, job_counts, last_refresh)
+        return
+
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.table import Table
+
     # Request usage panel
     usage_pct = request_stats.usage_percentage
-    if usage_pct > 80:
-        usage_style = "red"
-    elif usage_pct > 50:
-        usage_style = "yellow"
-    else:
-        usage_style = "green"
+    usage_style = _USAGE_STYLES[(usage_pct > 50) + (usage_pct > 80)]
 
     usage_bar = _create_progress_bar(usage_pct)
+    used = format(request_stats.requests_used, ",")
+    limit = format(request_stats.monthly_limit, ",")
+    remaining = format(request_stats.requests_remaining, ",")
 
     usage_content = [
-        f"[bold]Monthly API Usage ({request_stats.month})[/bold]",
-        "",
-        f"  {usage_bar} [{usage_style}]{usage_pct:.1f}%[/{usage_style}]",
-        f"  {request_stats.requests_used:,} / {request_stats.monthly_limit:,} requests",
-        f"  [dim]{request_stats.requests_remaining:,} remaining[/dim]",
+        Text(f"Monthly API Usage ({request_stats.month})", style="bold"),
+        Text(),
+        Text.assemble("  ", usage_bar, " ", (f"{usage_pct:.1f}%", usage_style)),
+        Text(f"  {used} / {limit} requests"),
+        Text.assemble("  ", (f"{remaining} remaining", "dim")),
     ]
 
-    console.print(Panel("\n".join(usage_content), title="API Usage", border_style="cyan"))
+    usage_panel = Panel(Group(*usage_content), title="API Usage", border_style="cyan")
 
     # Cache statistics table
     table = Table(title="Cache Statistics", show_header=True, header_style="bold cyan")
@@ -161,16 +245,93 @@ def display_stats(
     table.add_column("Jobs", style="green", justify="right")
     table.add_column("Last Refresh", style="dim")
 
-    total_jobs = 0
-    for source in sorted(job_counts.keys()):
-        count = job_counts[source]
-        total_jobs += count
-        refresh_time = last_refresh.get(source)
-        refresh_str = _format_relative_date(refresh_time) if refresh_time else "Never"
-        table.add_row(source, str(count), refresh_str)
+    # Sort once and carry the counts along instead of looking them up again
+    counts = sorted(job_counts.items())
+    refresh_times = [last_refresh.get(source) for source, _ in counts]
+    refresh_strs = _format_relative_dates(refresh_times)
+    for (source, count), refresh_time, refresh_str in zip(counts, refresh_times, refresh_strs):
+        table.add_row(source, str(count), refresh_str if refresh_time else "Never")
 
+    total_jobs = sum(job_counts.values())
     table.add_row("[bold]Total[/bold]", f"[bold]{total_jobs}[/bold]", "")
-    console.print(table)
+    _render(usage_panel, table)
+
+
+def _write_plain(lines: list[str]) -> None:
+    """Write preformatted lines to the console's file in one call."""
+    file = _get_console().file
+    file.write("\n".join(lines) + "\n")
+    file.flush()
+
+
+def _plain_display_jobs_table(jobs: list[JobPosting], show_source: bool) -> None:
+    """Write jobs as tab-separated rows, for output that is not a terminal."""
+    if show_source:
+        lines = ["#\tTitle\tCompany\tLocation\tSalary (RMB)\tSource"]
+        lines += [
+            f"{i}\t{j.title}\t{j.company}\t{j.location}\t{j.salary_range or '-'}\t{j.source}"
+            for i, j in enumerate(jobs, 1)
+        ]
+    else:
+        lines = ["#\tTitle\tCompany\tLocation\tSalary (RMB)"]
+        lines += [
+            f"{i}\t{j.title}\t{j.company}\t{j.location}\t{j.salary_range or '-'}"
+            for i, j in enumerate(jobs, 1)
+        ]
+    _write_plain(lines)
+
+
+def _plain_display_job_detail(job: JobPosting) -> None:
+    """Write a job's details as plain text, for output that is not a terminal."""
+    buf = StringIO()
+    w = buf.write
+    w(f"{job.title} @ {job.company}\nLocation:   {job.location}\n")
+    if job.salary_range:
+        w(f"Salary:     ¥{job.salary_range}/month\n")
+    if job.experience:
+        w(f"Experience: {job.experience}\n")
+    if job.education:
+        w(f"Education:  {job.education}\n")
+    if job.posted_date:
+        w(f"Posted:     {_format_relative_date(job.posted_date)}\n")
+    w(f"Source:     {job.source}\n")
+    if job.tags:
+        w(f"Tech Stack: {', '.join(job.tags)}\n")
+    if job.description:
+        w(f"\nDescription:\n{job.description}\n")
+    if job.requirements:
+        w("\nRequirements:\n")
+        for req in job.requirements:
+            w(f"  - {req}\n")
+    w(f"\nURL: {job.url}\n")
+
+    file = _get_console().file
+    file.write(buf.getvalue())
+    file.flush()
+
+
+def _plain_display_stats(
+    request_stats: RequestStats,
+    job_counts: dict[str, int],
+    last_refresh: dict[str, Optional[datetime]],
+) -> None:
+    """Write usage statistics as plain text, for output that is not a terminal."""
+    used = format(request_stats.requests_used, ",")
+    limit = format(request_stats.monthly_limit, ",")
+    remaining = format(request_stats.requests_remaining, ",")
+    lines = [
+        f"Monthly API Usage ({request_stats.month}): "
+        f"{used} / {limit} requests ({request_stats.usage_percentage:.1f}%), {remaining} remaining",
+        "",
+        "Source\tJobs\tLast Refresh",
+    ]
+    counts = sorted(job_counts.items())
+    refresh_times = [last_refresh.get(source) for source, _ in counts]
+    refresh_strs = _format_relative_dates(refresh_times)
+    for (source, count), refresh_time, refresh_str in zip(counts, refresh_times, refresh_strs):
+        lines.append(f"{source}\t{count}\t{refresh_str if refresh_time else 'Never'}")
+    lines.append(f"Total\t{sum(job_counts.values())}\t")
+    _write_plain(lines)
 
 
 def display_error(message: str, title: str = "Error") -> None:
@@ -180,7 +341,9 @@ def display_error(message: str, title: str = "Error") -> None:
         message: Error message
         title: Panel title
     """
-    console.print(Panel(f"[red]{message}[/red]", title=title, border_style="red"))
+    from rich.panel import Panel
+
+    _get_console().print(Panel(f"[red]{message}[/red]", title=title, border_style="red"))
 
 
 def display_success(message: str, title: str = "Success") -> None:
@@ -190,26 +353,31 @@ def display_success(message: str, title: str = "Success") -> None:
         message: Success message
         title: Panel title
     """
-    console.print(Panel(f"[green]{message}[/green]", title=title, border_style="green"))
+    from rich.panel import Panel
+
+    _get_console().print(Panel(f"[green]{message}[/green]", title=title, border_style="green"))
 
 
 def display_warning(message: str) -> None:
     """Display a warning message."""
-    console.print(f"[yellow]Warning:[/yellow] {message}")
+    _get_console().print(f"[yellow]Warning:[/yellow] {message}")
 
 
 def display_info(message: str) -> None:
     """Display an info message."""
-    console.print(f"[blue]Info:[/blue] {message}")
+    _get_console().print(f"[blue]Info:[/blue] {message}")
+
+
+def _labelled(label: Text, value: str) -> Text:
+    """Build a detail line from a prebuilt label and a plain value."""
+    line = label.copy()
+    line.append(value)
+    return line
 
 
-def _truncate(text: str, max_length: int) -> str:
+def _truncate(text: str, max_length: int, _len=len) -> str:
     """Truncate text to max length with ellipsis."""
-    if not text:
-        return ""
-    if len(text) <= max_length:
-        return text
-    return text[: max_length - 3] + "..."
+    return text[: max_length - 3] + _ELLIPSIS if text and _len(text) > max_length else (text or "")
 
 
 def _format_relative_date(dt: datetime) -> str:
@@ -219,26 +387,81 @@ def _format_relative_date(dt: datetime) -> str:
 
     now = datetime.now()
     diff = now - dt
+    days = diff.days
+    seconds = diff.seconds
 
-    if diff.days == 0:
-        hours = diff.seconds // 3600
+    if days == 0:
+        hours = seconds // 3600
         if hours == 0:
-            minutes = diff.seconds // 60
+            minutes = seconds // 60
             return f"{minutes} minutes ago" if minutes > 1 else "Just now"
         return f"{hours} hours ago" if hours > 1 else "1 hour ago"
-    elif diff.days == 1:
+    elif days == 1:
         return "Yesterday"
-    elif diff.days < 7:
-        return f"{diff.days} days ago"
-    elif diff.days < 30:
-        weeks = diff.days // 7
+    elif days < 7:
+        return f"{days} days ago"
+    elif days < 30:
+        weeks = days // 7
         return f"{weeks} weeks ago" if weeks > 1 else "1 week ago"
     else:
         return dt.strftime("%Y-%m-%d")
 
 
-def _create_progress_bar(percentage: float, width: int = 20) -> str:
-    """Create a text-based progress bar."""
-    filled = int(width * percentage / 100)
-    empty = width - filled
-    return f"[green]{'█' * filled}[/green][dim]{'░' * empty}[/dim]"
+# Upper bounds (in seconds) of the relative-date buckets used below
+_RELATIVE_BOUNDS = (120, 3600, 7200, 86400, 172800, 604800, 1209600, 2592000)
+
+
+def _format_relative_dates(dts: list[Optional[datetime]]) -> list[str]:
+    """Format many datetimes as relative strings against a single 'now'.
+
+    Produces the same text as _format_relative_date, but reads the clock once
+    and picks each bucket with a bisect instead of a chain of comparisons.
+    """
+    now = datetime.now().timestamp()
+    result = []
+    for dt in dts:
+        if not dt:
+            result.append("Unknown")
+            continue
+        secs = int(now - dt.timestamp())
+        bucket = bisect_right(_RELATIVE_BOUNDS, secs)
+        if bucket == 0:
+            result.append("Just now")
+        elif bucket == 1:
+            result.append(f"{secs // 60} minutes ago")
+        elif bucket == 2:
+            result.append("1 hour ago")
+        elif bucket == 3:
+            result.append(f"{secs // 3600} hours ago")
+        elif bucket == 4:
+            result.append("Yesterday")
+        elif bucket == 5:
+            result.append(f"{secs // 86400} days ago")
+        elif bucket == 6:
+            result.append("1 week ago")
+        elif bucket == 7:
+            result.append(f"{secs // 604800} weeks ago")
+        else:
+            result.append(dt.strftime("%Y-%m-%d"))
+    return result
+
+
+_BAR_WIDTH = 20
+
+# Usage colour, indexed by how many of the 50% / 80% thresholds are exceeded
+_USAGE_STYLES = ("green", "yellow", "red")
+
+# Every possible progress bar, indexed by the number of filled cells
+_BARS = tuple(
+    Text.assemble(("█" * filled, "green"), ("░" * (_BAR_WIDTH - filled), "dim"))
+    for filled in range(_BAR_WIDTH + 1)
+)
+
+
+def _create_progress_bar(percentage: float) -> Text:
+    """Create a text-based progress bar.
+
+    The returned Text is shared; copy it before modifying.
+    """
+    filled = int(_BAR_WIDTH * percentage / 100)
+    return _BARS[min(max(filled, 0), _BAR_WIDTH)]
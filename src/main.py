@@ -1,13 +1,25 @@
 """Main CLI entry point for jobs-cli."""
 
 import asyncio
+import csv
 import logging
-from typing import Annotated, Optional
-
+import re
+import traceback
+import webbrowser
+from collections.abc import Coroutine
+from pathlib import Path
+from typing import Annotated, Any, Optional
+
+import orjson
 import typer
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+try:
+    import uvloop
+except ImportError:  # Optional; not available on Windows
+    uvloop = None
+
 from .cache.database import Database
 from .client.mcp_client import BrightDataMCP, MCPConnectionError
 from .config import get_settings
@@ -20,7 +32,7 @@ from .display.ui import (
     display_success,
     display_warning,
 )
-from .models import JobPosting
+from .models import JobPosting, ScraperResult
 from .scrapers.zhaopin import ZhaopinScraper
 from .scrapers.linkedin import LinkedInScraper
 from .utils.parser import parse_salary_min, parse_experience_years
@@ -33,6 +45,13 @@ class AppState:
 state = AppState()
 
 
+def parse_tech_filter(tech: Optional[str]) -> list[str]:
+    """Split a comma-separated tech filter into lowercase keywords."""
+    if not tech:
+        return []
+    return [t.strip().lower() for t in tech.split(",") if t.strip()]
+
+
 def filter_jobs(
     jobs: list[JobPosting],
     tech: Optional[str] = None,
@@ -48,25 +67,41 @@ def filter_jobs(
         exp: Experience filter (e.g., "3-5" or "5+")
 
     Returns:
-        Filtered list of jobs
+        Filtered list of jobs (``jobs`` itself when no filter is set)
     """
+    if not tech and salary_min is None and not exp:
+        return jobs
+
     filtered = jobs
 
     # Filter by tech tags
     if tech:
-        tech_tags = [t.strip().lower() for t in tech.split(",")]
-        filtered = [
-            j for j in filtered
-            if any(tag.lower() in [t.lower() for t in j.tags] or
-                   any(tag in j.title.lower() or tag in (j.description or "").lower() for tag in tech_tags)
-                   for tag in tech_tags)
-        ]
+        tech_tags = parse_tech_filter(tech)
+        if len(tech_tags) >= 4:
+            # With many keywords, one alternation scans each text once
+            # instead of once per keyword
+            tag_set = frozenset(tech_tags)
+            pattern = re.compile("|".join(map(re.escape, tag_set)))
+            filtered = [
+                j for j in filtered
+                if not tag_set.isdisjoint(j.tags_lc) or pattern.search(j.text_lc)
+            ]
+        elif tech_tags:
+            # A job matches if any keyword is one of its tags or appears in
+            # its title or description (lowercased once per job, see JobPosting)
+            filtered = [
+                j for j in filtered
+                if any(t in j.tags_lc or t in j.text_lc for t in tech_tags)
+            ]
 
     # Filter by minimum salary
     if salary_min is not None:
         new_filtered = []
         for job in filtered:
-            job_salary = parse_salary_min(job.salary_range)
+            # Jobs loaded from the cache carry the parsed value already
+            job_salary = job.salary_min_k
+            if job_salary is None:
+                job_salary = parse_salary_min(job.salary_range)
             if job_salary is not None and job_salary >= salary_min:
                 new_filtered.append(job)
         filtered = new_filtered
@@ -76,32 +111,40 @@ def filter_jobs(
         exp_range = parse_experience_years(exp)
         if exp_range:
             req_min, req_max = exp_range
-            new_filtered = []
-            for job in filtered:
-                job_exp = parse_experience_years(job.experience)
-                if job_exp:
-                    job_min, job_max = job_exp
-                    # Job's requirements should overlap with user's experience
-                    # If user says "3-5", show jobs that accept 3-5 years
-                    if req_max is None:
-                        # User specified "5+", show jobs that accept 5+ years
-                        if job_max is None or job_max >= req_min:
-                            new_filtered.append(job)
-                    elif job_max is None:
-                        # Job requires "5+", check if user qualifies
-                        if req_max >= job_min:
-                            new_filtered.append(job)
-                    else:
-                        # Both have ranges, check overlap
-                        if job_min <= req_max and job_max >= req_min:
-                            new_filtered.append(job)
-                else:
-                    # No experience listed, include it
-                    new_filtered.append(job)
-            filtered = new_filtered
+            parse = parse_experience_years
+            # Jobs loaded from the cache carry the parsed range already
+            job_ranges = [
+                (j.exp_min, j.exp_max) if j.exp_min is not None else parse(j.experience)
+                for j in filtered
+            ]
+            # Keep jobs whose range overlaps the user's ("N+" has no upper
+            # bound on either side); jobs with no experience listed are kept
+            filtered = [
+                j for j, r in zip(filtered, job_ranges)
+                if r is None
+                or ((req_max is None or r[0] <= req_max) and (r[1] is None or r[1] >= req_min))
+            ]
 
     return filtered
 
+
+def _filter_suffix(
+    tech: Optional[str],
+    salary_min: Optional[int],
+    exp: Optional[str],
+    label: str = "",
+) -> str:
+    """Describe the active filters as " (label...)", or "" if there are none."""
+    parts = []
+    if tech:
+        parts.append(f"tech={tech}")
+    if salary_min:
+        parts.append(f"salary≥¥{salary_min}k")
+    if exp:
+        parts.append(f"exp={exp}")
+    return f" ({label}{', '.join(parts)})" if parts else ""
+
+
 def verbose_callback(value: bool) -> None:
     """Enable verbose output."""
     if value:
@@ -123,6 +166,11 @@ app = typer.Typer(
 console = Console()
 
 
+def run_async(coro: Coroutine[Any, Any, None]) -> None:
+    """Run a command's coroutine, on a uvloop event loop when it is installed."""
+    asyncio.run(coro, loop_factory=uvloop.new_event_loop if uvloop else None)
+
+
 async def check_rate_limit(db: Database) -> bool:
     """Check if we're approaching or over the rate limit.
     
@@ -130,10 +178,9 @@ async def check_rate_limit(db: Database) -> bool:
         True if OK to proceed, False if should use cache only
     """
     stats = await db.get_monthly_usage()
-    settings = get_settings()
     
     # Warning at 80% usage
-    if stats.requests_used >= settings.monthly_request_limit * 0.8:
+    if stats.requests_used >= stats.monthly_limit * 0.8:
         remaining = stats.requests_remaining
         if remaining <= 0:
             display_warning(
@@ -172,7 +219,7 @@ def search(
         jobs-cli search python --salary-min 20    # Min salary ¥20k
         jobs-cli search python --exp 3-5          # 3-5 years experience
     """
-    asyncio.run(_search_async(query, location, platform, limit, no_cache, tech, salary_min, exp))
+    run_async(_search_async(query, location, platform, limit, no_cache, tech, salary_min, exp))
 
 
 async def _search_async(
@@ -195,131 +242,139 @@ async def _search_async(
         )
         raise typer.Exit(1)
 
-    db = Database()
-
-    # Check cache first (unless --no-cache)
-    if not no_cache:
-        cached_jobs = await db.search_jobs(query, source=platform, limit=200)  # Get more to allow filtering
-        if cached_jobs:
-            # Apply filters
-            filtered_jobs = filter_jobs(cached_jobs, tech=tech, salary_min=salary_min, exp=exp)
-            
-            # Build filter info string
-            filter_info = []
-            if tech:
-                filter_info.append(f"tech={tech}")
-            if salary_min:
-                filter_info.append(f"salary≥¥{salary_min}k")
-            if exp:
-                filter_info.append(f"exp={exp}")
-            filter_str = f" (filters: {', '.join(filter_info)})" if filter_info else ""
+    tech_tags = parse_tech_filter(tech)
+    exp_range = parse_experience_years(exp)
+
+    async with Database() as db:
+        # Check cache first (unless --no-cache)
+        if not no_cache:
+            # Filters run in SQL against the columns parsed at save time, so
+            # only the rows that will be shown are fetched
+            filtered_jobs = await db.search_jobs(
+                query,
+                source=platform,
+                limit=limit,
+                tech=tech_tags,
+                salary_min_k=salary_min,
+                exp_range=exp_range,
+            )
+            if not filtered_jobs and (tech_tags or salary_min is not None or exp_range):
+                # Nothing matches the filters, but only scrape if nothing is cached at all
+                has_cached = bool(await db.search_jobs(query, source=platform, limit=1))
+            else:
+                has_cached = bool(filtered_jobs)
+            if has_cached:
+                filter_str = _filter_suffix(tech, salary_min, exp, "filters: ")
             
-            display_info(f"Showing {len(filtered_jobs[:limit])} of {len(cached_jobs)} cached results{filter_str}. Use --no-cache to refresh.")
-            display_jobs_table(filtered_jobs[:limit], title=f"Jobs matching '{query}'")
+                display_info(f"Showing {len(filtered_jobs)} cached results{filter_str}. Use --no-cache to refresh.")
+                display_jobs_table(filtered_jobs, title=f"Jobs matching '{query}'")
 
-            # Show request usage
-            stats = await db.get_monthly_usage()
-            console.print(f"\n[dim]API Usage: {stats.requests_used}/{stats.monthly_limit} requests this month[/dim]")
-            return
+                # Show request usage
+                stats = await db.get_monthly_usage()
+                console.print(f"\n[dim]API Usage: {stats.requests_used}/{stats.monthly_limit} requests this month[/dim]")
+                return
 
-    # Check rate limit before making API calls
-    if not await check_rate_limit(db):
-        # Rate limit reached, try to use any cached data
-        all_cached = await db.get_jobs(limit=200)
-        if all_cached:
-            filtered = filter_jobs(all_cached, tech=tech, salary_min=salary_min, exp=exp)
+        # Check rate limit before making API calls
+        if not await check_rate_limit(db):
+            # Rate limit reached, try to use any cached data
+            filtered = await db.get_jobs(
+                limit=limit, tech=tech_tags, salary_min_k=salary_min, exp_range=exp_range
+            )
             if filtered:
                 display_info("Showing all cached jobs due to rate limit.")
-                display_jobs_table(filtered[:limit], title="Cached Jobs (rate limited)")
+                display_jobs_table(filtered, title="Cached Jobs (rate limited)")
                 return
-        display_error("No cached data available and API limit reached.")
-        raise typer.Exit(1)
+            display_error("No cached data available and API limit reached.")
+            raise typer.Exit(1)
 
-    # No cache or forced refresh - need to scrape
-    all_jobs: list[JobPosting] = []
+        # No cache or forced refresh - need to scrape
+        all_jobs: list[JobPosting] = []
 
-    # Determine which scrapers to use
-    if platform == "all":
-        scrapers_to_use = ["zhaopin", "linkedin"]
-    elif platform:
-        scrapers_to_use = [platform]
-    else:
-        scrapers_to_use = ["zhaopin"]  # Default to zhaopin
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        for scraper_name in scrapers_to_use:
-            task = progress.add_task(f"Searching {scraper_name}...", total=None)
-            try:
-                mcp = BrightDataMCP()
-                
-                if scraper_name == "zhaopin":
-                    scraper = ZhaopinScraper(mcp)
-                    result = await scraper.search(query, location)
-                elif scraper_name == "linkedin":
-                    scraper = LinkedInScraper(mcp)
-                    # LinkedIn API needs broader search, then we filter results
-                    result = await scraper.search(query, location, filter_location=True)
-                else:
-                    if not state.quiet:
-                        display_info(f"Scraper '{scraper_name}' not yet implemented")
-                    progress.remove_task(task)
-                    continue
-
-                # Track the request
-                await db.increment_request_count(1)
-
-                if result.error:
-                    display_warning(f"{scraper_name}: {result.error}")
-                elif result.jobs:
-                    all_jobs.extend(result.jobs)
-                    progress.update(task, description=f"[green]{scraper_name}: found {len(result.jobs)} jobs[/green]")
-                else:
-                    progress.update(task, description=f"[yellow]{scraper_name}: no jobs found[/yellow]")
-
-            except MCPConnectionError as e:
-                display_warning(f"{scraper_name}: Connection failed after retries. Using cached data if available.")
-                if state.verbose:
-                    console.print(f"[dim]Error details: {e}[/dim]")
-            except Exception as e:
-                display_warning(f"{scraper_name} error: {e}")
-                if state.verbose:
-                    import traceback
-                    console.print(f"[dim]{traceback.format_exc()}[/dim]")
-            finally:
-                progress.remove_task(task)
-
-    if not all_jobs:
-        display_info("No jobs found. Try a different search query or platform.")
-        return
-
-    # Save to cache
-    saved_count = await db.save_jobs(all_jobs)
-    await db.set_last_refresh("zhaopin")
-
-    # Apply filters
-    filtered_jobs = filter_jobs(all_jobs, tech=tech, salary_min=salary_min, exp=exp)
+        # Determine which scrapers to use
+        if platform == "all":
+            scrapers_to_use = ["zhaopin", "linkedin"]
+        elif platform:
+            scrapers_to_use = [platform]
+        else:
+            scrapers_to_use = ["zhaopin"]  # Default to zhaopin
+
+        async with BrightDataMCP() as mcp:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console,
+            ) as progress:
+
+                async def _run_scraper(scraper_name: str) -> Optional[ScraperResult]:
+                    """Run one scraper, reporting failures instead of raising."""
+                    task = progress.add_task(f"Searching {scraper_name}...", total=None)
+                    try:
+                        if scraper_name == "zhaopin":
+                            scraper = ZhaopinScraper(mcp)
+                            result = await scraper.search(query, location)
+                        elif scraper_name == "linkedin":
+                            scraper = LinkedInScraper(mcp)
+                            # LinkedIn API needs broader search, then we filter results
+                            result = await scraper.search(query, location, filter_location=True)
+                        else:
+                            if not state.quiet:
+                                display_info(f"Scraper '{scraper_name}' not yet implemented")
+                            return None
+
+                        if result.error:
+                            display_warning(f"{scraper_name}: {result.error}")
+                        elif result.jobs:
+                            progress.update(task, description=f"[green]{scraper_name}: found {len(result.jobs)} jobs[/green]")
+                        else:
+                            progress.update(task, description=f"[yellow]{scraper_name}: no jobs found[/yellow]")
+                        return result
+
+                    except MCPConnectionError as e:
+                        display_warning(f"{scraper_name}: Connection failed after retries. Using cached data if available.")
+                        if state.verbose:
+                            console.print(f"[dim]Error details: {e}[/dim]")
+                    except Exception as e:
+                        display_warning(f"{scraper_name} error: {e}")
+                        if state.verbose:
+                            console.print(f"[dim]{traceback.format_exc()}[/dim]")
+                    finally:
+                        progress.remove_task(task)
+                    return None
+
+                # Platforms are independent, so scrape them concurrently
+                results = await asyncio.gather(
+                    *(_run_scraper(name) for name in scrapers_to_use),
+                    return_exceptions=True,
+                )
+
+        # Track the requests that reached the API in one write
+        completed = [r for r in results if isinstance(r, ScraperResult)]
+        if completed:
+            await db.increment_request_count(len(completed))
+        for result in completed:
+            if not result.error:
+                all_jobs.extend(result.jobs)
+
+        if not all_jobs:
+            display_info("No jobs found. Try a different search query or platform.")
+            return
+
+        # Save to cache
+        saved_count = await db.save_jobs(all_jobs)
+        await db.set_last_refresh("zhaopin")
+
+        # Apply filters
+        filtered_jobs = filter_jobs(all_jobs, tech=tech, salary_min=salary_min, exp=exp)
     
-    # Build filter info string
-    filter_info = []
-    if tech:
-        filter_info.append(f"tech={tech}")
-    if salary_min:
-        filter_info.append(f"salary≥¥{salary_min}k")
-    if exp:
-        filter_info.append(f"exp={exp}")
-    filter_str = f" (filters: {', '.join(filter_info)})" if filter_info else ""
+        filter_str = _filter_suffix(tech, salary_min, exp, "filters: ")
 
-    # Display results
-    display_jobs_table(filtered_jobs[:limit], title=f"Jobs matching '{query}'{filter_str}")
+        # Display results
+        display_jobs_table(filtered_jobs[:limit], title=f"Jobs matching '{query}'{filter_str}")
 
-    # Show stats
-    stats = await db.get_monthly_usage()
-    filter_note = f" ({len(filtered_jobs)} after filters)" if filter_str else ""
-    console.print(f"\n[dim]Found {len(all_jobs)} jobs{filter_note}. API Usage: {stats.requests_used}/{stats.monthly_limit} requests this month[/dim]")
+        # Show stats
+        stats = await db.get_monthly_usage()
+        filter_note = f" ({len(filtered_jobs)} after filters)" if filter_str else ""
+        console.print(f"\n[dim]Found {len(all_jobs)} jobs{filter_note}. API Usage: {stats.requests_used}/{stats.monthly_limit} requests this month[/dim]")
 
 
 @app.command("list")
@@ -332,7 +387,7 @@ def list_jobs(
     exp: Optional[str] = typer.Option(None, "--exp", help="Experience filter (e.g., '3-5' or '5+')"),
 ) -> None:
     """List cached jobs."""
-    asyncio.run(_list_async(source, limit, sort_by, tech, salary_min, exp))
+    run_async(_list_async(source, limit, sort_by, tech, salary_min, exp))
 
 
 async def _list_async(
@@ -344,41 +399,45 @@ async def _list_async(
     exp: Optional[str],
 ) -> None:
     """Async implementation of list command."""
-    db = Database()
-    jobs = await db.get_jobs(source=source, limit=500)  # Get more to allow filtering
-
-    if not jobs:
-        display_info("No jobs in cache. Run 'jobs-cli search <query>' to fetch jobs.")
-        return
-
-    # Apply filters
-    filtered_jobs = filter_jobs(jobs, tech=tech, salary_min=salary_min, exp=exp)
-
-    # Sort if needed
-    if sort_by == "company":
-        filtered_jobs.sort(key=lambda j: j.company.lower())
-    elif sort_by == "salary":
-        # Sort by salary (jobs with salary first, then by amount descending)
-        def salary_sort_key(j: JobPosting) -> tuple[bool, int]:
-            sal = parse_salary_min(j.salary_range)
-            return (j.salary_range is None, -(sal or 0))
-        filtered_jobs.sort(key=salary_sort_key)
-
-    # Build filter info
-    filter_info = []
-    if tech:
-        filter_info.append(f"tech={tech}")
-    if salary_min:
-        filter_info.append(f"salary≥¥{salary_min}k")
-    if exp:
-        filter_info.append(f"exp={exp}")
-    filter_str = f" ({', '.join(filter_info)})" if filter_info else ""
+    tech_tags = parse_tech_filter(tech)
+    exp_range = parse_experience_years(exp)
+
+    async with Database() as db:
+        # Filters run in SQL against the columns parsed at save time. Date
+        # order is the query's own, so only company/salary sorts need a wider
+        # pool of recent jobs to sort.
+        filtered_jobs = await db.get_jobs(
+            source=source,
+            limit=500 if sort_by in ("company", "salary") else limit,
+            tech=tech_tags,
+            salary_min_k=salary_min,
+            exp_range=exp_range,
+        )
+        if tech_tags or salary_min is not None or exp_range:
+            total = await db.get_job_count(source)
+        else:
+            total = len(filtered_jobs)
+
+        if not total:
+            display_info("No jobs in cache. Run 'jobs-cli search <query>' to fetch jobs.")
+            return
+
+        # Sort if needed
+        if sort_by == "company":
+            filtered_jobs.sort(key=lambda j: j.company.lower())
+        elif sort_by == "salary":
+            # Sort by salary (jobs with salary first, then by amount descending);
+            # salary_min_k was parsed when the job was cached
+            filtered_jobs.sort(key=lambda j: (j.salary_range is None, -(j.salary_min_k or 0)))
+
+        filter_str = _filter_suffix(tech, salary_min, exp)
     
-    title = f"Cached Jobs{filter_str}"
-    if len(filtered_jobs) < len(jobs):
-        display_info(f"Showing {len(filtered_jobs[:limit])} of {len(jobs)} total jobs (filtered)")
+        title = f"Cached Jobs{filter_str}"
+        view = filtered_jobs[:limit]
+        if len(filtered_jobs) < total:
+            display_info(f"Showing {len(view)} of {total} total jobs (filtered)")
     
-    display_jobs_table(filtered_jobs[:limit], title=title, show_source=True)
+        display_jobs_table(view, title=title, show_source=True)
 
 
 @app.command()
@@ -387,61 +446,57 @@ def show(
     open_url: bool = typer.Option(False, "--open", "-o", help="Open job URL in browser"),
 ) -> None:
     """Show detailed information about a job."""
-    asyncio.run(_show_async(job_id, open_url))
+    run_async(_show_async(job_id, open_url))
 
 
 async def _show_async(job_id: str, open_url: bool) -> None:
     """Async implementation of show command."""
-    import webbrowser
-
-    db = Database()
-
-    # Try to find by ID first
-    job = await db.get_job(job_id)
-
-    if not job:
-        # Maybe it's a number from the list?
-        try:
-            idx = int(job_id) - 1
-            jobs = await db.get_jobs(limit=100)
-            if 0 <= idx < len(jobs):
-                job = jobs[idx]
-        except ValueError:
-            pass
+    async with Database() as db:
+        # Try to find by ID first
+        job = await db.get_job(job_id)
 
-    if not job:
-        display_error(f"Job not found: {job_id}")
-        raise typer.Exit(1)
+        if not job:
+            # Maybe it's a number from the list?
+            try:
+                idx = int(job_id) - 1
+                jobs = await db.get_jobs(limit=100)
+                if 0 <= idx < len(jobs):
+                    job = jobs[idx]
+            except ValueError:
+                pass
+
+        if not job:
+            display_error(f"Job not found: {job_id}")
+            raise typer.Exit(1)
 
-    display_job_detail(job)
+        display_job_detail(job)
 
-    if open_url:
-        console.print(f"\n[dim]Opening {job.url} in browser...[/dim]")
-        webbrowser.open(job.url)
+        if open_url:
+            console.print(f"\n[dim]Opening {job.url} in browser...[/dim]")
+            webbrowser.open(job.url)
 
 
 @app.command()
 def stats() -> None:
     """Show usage statistics and cache information."""
-    asyncio.run(_stats_async())
+    run_async(_stats_async())
 
 
 async def _stats_async() -> None:
     """Async implementation of stats command."""
-    db = Database()
-    settings = get_settings()
+    async with Database() as db:
+        settings = get_settings()
 
-    # Get request stats
-    request_stats = await db.get_monthly_usage()
+        # Get request stats
+        request_stats = await db.get_monthly_usage()
 
-    # Get job counts per source
-    job_counts = {}
-    last_refresh = {}
-    for source in settings.enabled_scrapers:
-        job_counts[source] = await db.get_job_count(source)
-        last_refresh[source] = await db.get_last_refresh(source)
+        # Get job counts and refresh times for all sources at once
+        counts = await db.get_job_counts_by_source()
+        refreshed = await db.get_last_refresh_all()
+        job_counts = {source: counts.get(source, 0) for source in settings.enabled_scrapers}
+        last_refresh = {source: refreshed.get(source) for source in settings.enabled_scrapers}
 
-    display_stats(request_stats, job_counts, last_refresh)
+        display_stats(request_stats, job_counts, last_refresh)
 
 
 @app.command()
@@ -474,7 +529,7 @@ def export(
     limit: int = typer.Option(1000, "-n", "--limit", help="Maximum jobs to export"),
 ) -> None:
     """Export jobs to JSON or CSV file."""
-    asyncio.run(_export_async(output, format, source, tech, salary_min, exp, limit))
+    run_async(_export_async(output, format, source, tech, salary_min, exp, limit))
 
 
 async def _export_async(
@@ -487,23 +542,6 @@ async def _export_async(
     limit: int,
 ) -> None:
     """Async implementation of export command."""
-    import csv
-    import json
-    from pathlib import Path
-
-    db = Database()
-    jobs = await db.get_jobs(source=source, limit=limit)
-
-    if not jobs:
-        display_info("No jobs in cache to export.")
-        return
-
-    # Apply filters
-    filtered_jobs = filter_jobs(jobs, tech=tech, salary_min=salary_min, exp=exp)
-
-    if not filtered_jobs:
-        display_info("No jobs match the specified filters.")
-        return
 
     # Determine format
     output_path = Path(output)
@@ -515,19 +553,48 @@ async def _export_async(
         else:
             display_error("Cannot determine format from filename. Use --format json or --format csv")
             raise typer.Exit(1)
+    if format not in ("json", "csv"):
+        display_error(f"Unknown format: {format}. Use json or csv.")
+        raise typer.Exit(1)
+
+    async with Database() as db:
+        if not await db.get_job_count(source):
+            display_info("No jobs in cache to export.")
+            return
+
+        # Filters run in SQL against the columns parsed at save time; rows
+        # are streamed from the cursor straight into the file
+        jobs = db.iter_jobs(
+            source=source,
+            limit=limit,
+            tech=parse_tech_filter(tech),
+            salary_min_k=salary_min,
+            exp_range=parse_experience_years(exp),
+        )
+        first = await anext(jobs, None)
+        if first is None:
+            display_info("No jobs match the specified filters.")
+            return
 
-    # Export
-    if format == "json":
-        data = [job.model_dump(mode="json") for job in filtered_jobs]
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-    elif format == "csv":
-        fieldnames = ["title", "company", "location", "salary_range", "experience", "education", "url", "source", "tags"]
-        with open(output_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for job in filtered_jobs:
-                writer.writerow({
+        # Export
+        if format == "json":
+            # orjson writes UTF-8 bytes and encodes datetimes itself. Each
+            # object is indented one level, laid out as in an indent=2 array;
+            # newlines inside strings are escaped, so only layout ones shift.
+            def json_item(job: JobPosting) -> bytes:
+                item = orjson.dumps(job.model_dump(), option=orjson.OPT_INDENT_2)
+                return b"  " + item.replace(b"\n", b"\n  ")
+
+            with open(output_path, "wb") as f:
+                f.write(b"[\n" + json_item(first))
+                count = 1
+                async for job in jobs:
+                    f.write(b",\n" + json_item(job))
+                    count += 1
+                f.write(b"\n]")
+        else:
+            def csv_row(job: JobPosting) -> dict[str, str]:
+                return {
                     "title": job.title,
                     "company": job.company,
                     "location": job.location,
@@ -537,12 +604,19 @@ async def _export_async(
                     "url": job.url,
                     "source": job.source,
                     "tags": ", ".join(job.tags),
-                })
-    else:
-        display_error(f"Unknown format: {format}. Use json or csv.")
-        raise typer.Exit(1)
+                }
+
+            fieldnames = ["title", "company", "location", "salary_range", "experience", "education", "url", "source", "tags"]
+            with open(output_path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer.writeheader()
+                writer.writerow(csv_row(first))
+                count = 1
+                async for job in jobs:
+                    writer.writerow(csv_row(job))
+                    count += 1
 
-    display_success(f"Exported {len(filtered_jobs)} jobs to {output_path}")
+        display_success(f"Exported {count} jobs to {output_path}")
 
 
 @app.command()
@@ -552,7 +626,7 @@ def refresh(
     location: str = typer.Option("Beijing", "-l", "--location", help="Location filter"),
 ) -> None:
     """Refresh job listings from platforms."""
-    asyncio.run(_refresh_async(platform, query, location))
+    run_async(_refresh_async(platform, query, location))
 
 
 async def _refresh_async(
@@ -570,87 +644,93 @@ async def _refresh_async(
         )
         raise typer.Exit(1)
 
-    db = Database()
-    
-    # Determine which scrapers to use
-    platforms_to_refresh = [platform] if platform else ["zhaopin"]  # Only zhaopin works reliably
-    total_new_jobs = 0
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        for scraper_name in platforms_to_refresh:
-            if scraper_name == "zhaopin":
-                task = progress.add_task(f"Refreshing {scraper_name}...", total=None)
-                try:
-                    mcp = BrightDataMCP()
-                    scraper = ZhaopinScraper(mcp)
-                    result = await scraper.search(query, location)
-
-                    # Track the request
-                    await db.increment_request_count(1)
-
-                    if result.error:
-                        progress.update(task, description=f"[red]{scraper_name}: {result.error}[/red]")
-                    elif result.jobs:
-                        # Count new vs updated
-                        existing_count = await db.get_job_count(scraper_name)
-                        saved_count = await db.save_jobs(result.jobs)
-                        await db.set_last_refresh(scraper_name)
-                        new_count = await db.get_job_count(scraper_name) - existing_count
-                        total_new_jobs += max(0, new_count)
-                        progress.update(task, description=f"[green]{scraper_name}: {len(result.jobs)} jobs (cached)[/green]")
+    async with Database() as db:
+        # Determine which scrapers to use
+        platforms_to_refresh = [platform] if platform else ["zhaopin"]  # Only zhaopin works reliably
+        total_new_jobs = 0
+        requests_made = 0
+
+        async with BrightDataMCP() as mcp:
+            # One scraper per platform, all sharing the open MCP session
+            scrapers = {"zhaopin": ZhaopinScraper(mcp)}
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console,
+            ) as progress:
+                for scraper_name in platforms_to_refresh:
+                    scraper = scrapers.get(scraper_name)
+                    if scraper is not None:
+                        task = progress.add_task(f"Refreshing {scraper_name}...", total=None)
+                        try:
+                            result = await scraper.search(query, location)
+                            requests_made += 1
+
+                            if result.error:
+                                progress.update(task, description=f"[red]{scraper_name}: {result.error}[/red]")
+                            elif result.jobs:
+                                # Count new vs updated
+                                existing_count = await db.get_job_count(scraper_name)
+                                saved_count = await db.save_jobs(result.jobs)
+                                await db.set_last_refresh(scraper_name)
+                                new_count = await db.get_job_count(scraper_name) - existing_count
+                                total_new_jobs += max(0, new_count)
+                                progress.update(task, description=f"[green]{scraper_name}: {len(result.jobs)} jobs (cached)[/green]")
+                            else:
+                                progress.update(task, description=f"[yellow]{scraper_name}: no jobs found[/yellow]")
+
+                        except Exception as e:
+                            progress.update(task, description=f"[red]{scraper_name}: error - {e}[/red]")
+                        finally:
+                            progress.remove_task(task)
                     else:
-                        progress.update(task, description=f"[yellow]{scraper_name}: no jobs found[/yellow]")
+                        display_warning(f"Scraper '{scraper_name}' not yet implemented")
 
-                except Exception as e:
-                    progress.update(task, description=f"[red]{scraper_name}: error - {e}[/red]")
-                finally:
-                    progress.remove_task(task)
-            else:
-                display_warning(f"Scraper '{scraper_name}' not yet implemented")
+        # Track the requests that reached the API in one write
+        if requests_made:
+            await db.increment_request_count(requests_made)
 
-    # Show summary
-    stats = await db.get_monthly_usage()
-    total_cached = await db.get_job_count()
-    display_success(f"Refresh complete. {total_cached} total jobs cached.")
-    console.print(f"[dim]API Usage: {stats.requests_used}/{stats.monthly_limit} requests this month[/dim]")
+        # Show summary
+        stats = await db.get_monthly_usage()
+        total_cached = await db.get_job_count()
+        display_success(f"Refresh complete. {total_cached} total jobs cached.")
+        console.print(f"[dim]API Usage: {stats.requests_used}/{stats.monthly_limit} requests this month[/dim]")
 
 
 @app.command("clear-cache")
 def clear_cache(
     older_than: int = typer.Option(30, "--older-than", "-d", help="Delete jobs older than N days"),
     force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation prompt"),
+    compact: bool = typer.Option(False, "--compact", help="Also purge deleted jobs and shrink the database file"),
 ) -> None:
     """Clear old jobs from the cache."""
-    asyncio.run(_clear_cache_async(older_than, force))
+    run_async(_clear_cache_async(older_than, force, compact))
 
 
-async def _clear_cache_async(older_than: int, force: bool) -> None:
+async def _clear_cache_async(older_than: int, force: bool, compact: bool = False) -> None:
     """Async implementation of clear-cache command."""
-    db = Database()
+    async with Database() as db:
+        # Get current count
+        current_count = await db.get_job_count()
     
-    # Get current count
-    current_count = await db.get_job_count()
-    
-    if current_count == 0:
-        display_info("Cache is already empty.")
-        return
-    
-    if not force:
-        console.print(f"\nThis will delete jobs older than {older_than} days from the cache.")
-        console.print(f"Current cache has {current_count} jobs.")
-        confirm = typer.confirm("Continue?")
-        if not confirm:
-            display_info("Cancelled.")
+        if current_count == 0:
+            display_info("Cache is already empty.")
             return
     
-    deleted = await db.delete_old_jobs(days=older_than)
-    remaining = await db.get_job_count()
+        if not force:
+            console.print(f"\nThis will delete jobs older than {older_than} days from the cache.")
+            console.print(f"Current cache has {current_count} jobs.")
+            confirm = typer.confirm("Continue?")
+            if not confirm:
+                display_info("Cancelled.")
+                return
+    
+        deleted = await db.delete_old_jobs(days=older_than)
+        if compact:
+            await db.compact()
+        remaining = await db.get_job_count()
     
-    display_success(f"Deleted {deleted} old jobs. {remaining} jobs remaining in cache.")
+        display_success(f"Deleted {deleted} old jobs. {remaining} jobs remaining in cache.")
 
 
 @app.command()
@@ -682,7 +762,7 @@ def tui() -> None:
 @app.command()
 def test_connection() -> None:
     """Test the connection to Bright Data MCP."""
-    asyncio.run(_test_connection_async())
+    run_async(_test_connection_async())
 
 
 async def _test_connection_async() -> None:
@@ -699,8 +779,8 @@ async def _test_connection_async() -> None:
     console.print("Testing connection to Bright Data MCP...")
 
     try:
-        mcp = BrightDataMCP()
-        tools = await mcp.list_available_tools()
+        async with BrightDataMCP() as mcp:
+            tools = await mcp.list_available_tools()
         display_success("Connection successful!")
         console.print(f"\n[bold]Available tools:[/bold]")
         for tool in tools:
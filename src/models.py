@@ -1,14 +1,18 @@
 """Pydantic data models for job postings and queries."""
 
 from datetime import datetime
+from functools import cached_property
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class JobPosting(BaseModel):
     """A job posting from a Chinese job platform."""
 
+    # Jobs are never modified after parsing; datetimes serialize natively
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(description="Unique identifier (usually from URL)")
     title: str = Field(description="Job title")
     company: str = Field(description="Company name")
@@ -24,14 +28,31 @@ class JobPosting(BaseModel):
     source: str = Field(description="Platform name (boss_zhipin, zhaopin, etc.)")
     fetched_at: datetime = Field(default_factory=datetime.now, description="When we scraped this")
     is_active: bool = Field(default=True, description="Whether the job is still active")
+    # Parsed from salary_range/experience when the job is saved; only set on
+    # jobs loaded from the cache and never serialized
+    salary_min_k: Optional[int] = Field(default=None, exclude=True, description="Minimum salary in k")
+    exp_min: Optional[int] = Field(default=None, exclude=True, description="Minimum years of experience")
+    exp_max: Optional[int] = Field(default=None, exclude=True, description="Maximum years (None for 'N+')")
+
+    # Lowercased once per job for the tech filter; cached_property values are
+    # not fields, so they are never validated or serialized
+
+    @cached_property
+    def tags_lc(self) -> frozenset[str]:
+        """Lowercased tags."""
+        return frozenset(tag.lower() for tag in self.tags)
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
+    @cached_property
+    def text_lc(self) -> str:
+        """Lowercased title and description, joined by a NUL separator."""
+        return f"{self.title}\0{self.description or ''}".lower()
 
 
 class SearchQuery(BaseModel):
     """Parameters for a job search."""
 
+    model_config = ConfigDict(frozen=True)
+
     query: str = Field(description="Search query (job title, keywords)")
     location: str = Field(default="Beijing", description="City/location filter")
     salary_min: Optional[int] = Field(default=None, description="Minimum salary in k (e.g., 20 for 20k)")
@@ -43,6 +64,8 @@ class SearchQuery(BaseModel):
 class ScraperResult(BaseModel):
     """Result from a scraper operation."""
 
+    model_config = ConfigDict(frozen=True)
+
     jobs: list[JobPosting] = Field(default_factory=list, description="List of jobs found")
     total_count: int = Field(default=0, description="Total jobs available (may be > len(jobs))")
     page: int = Field(default=1, description="Current page")
@@ -54,6 +77,8 @@ class ScraperResult(BaseModel):
 class RequestStats(BaseModel):
     """Statistics about API request usage."""
 
+    model_config = ConfigDict(frozen=True)
+
     month: str = Field(description="Month in YYYY-MM format")
     requests_used: int = Field(default=0, description="Requests used this month")
     monthly_limit: int = Field(default=5000, description="Monthly request limit")
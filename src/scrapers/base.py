@@ -1,11 +1,21 @@
 """Base scraper class for job platforms."""
 
+import asyncio
+import hashlib
+import threading
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional
 
 from ..client.mcp_client import BrightDataMCP
 from ..models import JobPosting, ScraperResult
 
+# Most search pages kept parsed, keyed by scraper name and markdown digest
+_PARSE_CACHE_SIZE = 128
+_parse_cache: dict[tuple[str, bytes], list[JobPosting]] = {}
+# Pages may be parsed in worker threads, so updates to the cache are locked
+_parse_cache_lock = threading.Lock()
+
 
 class BaseScraper(ABC):
     """Abstract base class for job scrapers."""
@@ -14,6 +24,11 @@ class BaseScraper(ABC):
     name: str = ""
     base_url: str = ""
 
+    # Throttling for scrape_url: requests in flight at once, and the minimum
+    # spacing in seconds between request starts
+    max_concurrent_requests: int = 3
+    min_request_interval: float = 0.1
+
     def __init__(self, mcp_client: Optional[BrightDataMCP] = None):
         """Initialize the scraper.
 
@@ -21,6 +36,8 @@ class BaseScraper(ABC):
             mcp_client: MCP client instance. Creates a new one if not provided.
         """
         self.mcp = mcp_client or BrightDataMCP()
+        self._request_slots = asyncio.Semaphore(self.max_concurrent_requests)
+        self._next_request_at = 0.0
 
     @abstractmethod
     async def search(
@@ -41,6 +58,29 @@ class BaseScraper(ABC):
         """
         pass
 
+    async def search_pages(
+        self,
+        query: str,
+        location: str = "Beijing",
+        start: int = 1,
+        count: int = 5,
+    ) -> list[ScraperResult]:
+        """Search several consecutive result pages concurrently.
+
+        Requests are throttled by scrape_url, so this only fans out the pages.
+
+        Args:
+            query: Search query (job title, keywords)
+            location: Location filter
+            start: First page number to fetch
+            count: Number of pages to fetch
+
+        Returns:
+            One ScraperResult per page, in page order
+        """
+        pages = range(start, start + count)
+        return await asyncio.gather(*(self.search(query, location, page) for page in pages))
+
     @abstractmethod
     async def get_detail(self, job_url: str) -> Optional[JobPosting]:
         """Get detailed information for a specific job.
@@ -53,10 +93,37 @@ class BaseScraper(ABC):
         """
         pass
 
-    @abstractmethod
     def parse_search_results(self, markdown: str) -> list[JobPosting]:
         """Parse search results page markdown into job listings.
 
+        Retries and repeated pages often return identical markdown, so parsed
+        results are memoized on a digest of the content. Jobs served from the
+        memo are stamped with the current time, like a fresh parse.
+
+        Args:
+            markdown: Markdown content from search results page
+
+        Returns:
+            List of JobPosting objects (may have incomplete data)
+        """
+        key = (self.name, hashlib.blake2b(markdown.encode(), digest_size=16).digest())
+        jobs = _parse_cache.get(key)
+        if jobs is not None:
+            fetched_at = datetime.now()
+            return [job.model_copy(update={"fetched_at": fetched_at}) for job in jobs]
+
+        jobs = self._parse_search_results(markdown)
+        with _parse_cache_lock:
+            if len(_parse_cache) >= _PARSE_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del _parse_cache[next(iter(_parse_cache))]
+            _parse_cache[key] = jobs
+        return list(jobs)
+
+    @abstractmethod
+    def _parse_search_results(self, markdown: str) -> list[JobPosting]:
+        """Parse search results page markdown, bypassing the parse cache.
+
         Args:
             markdown: Markdown content from search results page
 
@@ -100,13 +167,24 @@ class BaseScraper(ABC):
     async def scrape_url(self, url: str) -> str:
         """Scrape a URL and return markdown content.
 
+        At most max_concurrent_requests scrapes run at once per scraper, and
+        their starts are spaced min_request_interval apart so bursts of pages
+        don't trip upstream throttling.
+
         Args:
             url: URL to scrape
 
         Returns:
             Markdown content of the page
         """
-        return await self.mcp.scrape_as_markdown(url)
+        async with self._request_slots:
+            now = asyncio.get_running_loop().time()
+            # Reserve the next start slot before sleeping so waiters queue up
+            start_at = max(now, self._next_request_at)
+            self._next_request_at = start_at + self.min_request_interval
+            if start_at > now:
+                await asyncio.sleep(start_at - now)
+            return await self.mcp.scrape_as_markdown(url)
 
     def generate_job_id(self, url: str) -> str:
         """Generate a unique job ID from the URL.
@@ -118,6 +196,4 @@ class BaseScraper(ABC):
             Unique identifier string
         """
         # Default implementation: use hash of URL
-        import hashlib
-
         return hashlib.md5(url.encode()).hexdigest()[:12]
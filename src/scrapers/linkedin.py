@@ -1,15 +1,21 @@
 """LinkedIn job scraper."""
 
+import asyncio
+import logging
 import re
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain, pairwise
 from typing import Optional
-from urllib.parse import quote, urljoin, unquote
+from urllib.parse import quote, unquote
 
 from . import register_scraper
 from .base import BaseScraper
 from ..models import JobPosting, ScraperResult
 from ..utils.parser import extract_tags
 
+logger = logging.getLogger(__name__)
+
 
 # LinkedIn location IDs (geoId)
 LOCATION_IDS = {
@@ -25,6 +31,53 @@ LOCATION_IDS = {
     "广州": "102511908",
 }
 
+_CHINA_GEO_ID = LOCATION_IDS["china"]
+
+# Paging through results re-quotes the same query, so memoize it
+_quote = lru_cache(maxsize=256)(quote)
+
+# Names a job location may appear under, for filtering by city
+LOCATION_PATTERNS = {
+    "beijing": ("beijing", "北京"),
+    "北京": ("beijing", "北京"),
+    "shanghai": ("shanghai", "上海"),
+    "上海": ("shanghai", "上海"),
+    "shenzhen": ("shenzhen", "深圳"),
+    "深圳": ("shenzhen", "深圳"),
+    "guangzhou": ("guangzhou", "广州"),
+    "广州": ("guangzhou", "广州"),
+}
+
+
+@lru_cache(maxsize=32)
+def _location_patterns(location: str) -> tuple[str, ...]:
+    """Get the lowercased names a job location may match for a filter location."""
+    location_lower = location.lower()
+    return LOCATION_PATTERNS.get(location_lower, (location_lower,))
+
+
+# Words that mark a fallback location match as some other line of the listing
+_NON_LOCATION_WORDS = ('applicant', 'ago', 'week', 'month', 'day', 'hour')
+
+# Patterns used when parsing guest API results, compiled once at import
+_ITEM_START_RE = re.compile(r'\n\*\s+\[')
+_TITLE_RE = re.compile(r'([^\]]+)\]\((https?://[^\)]+)\)')
+# Company, location and posted time in one alternation, so a block is
+# scanned once and each match is dispatched on its outer group name
+_BLOCK_RE = re.compile(
+    r'(?P<company>####\s+\[(?P<company_name>[^\]]+)\])'
+    r'|(?P<time>(?P<time_n>\d+)\s+(?P<time_unit>hour|day|week|month)s?\s+ago)'
+    r'|(?P<loc>\n\s+(?P<loc_text>[A-Za-z\u4e00-\u9fff][^\n]+(?:China|中国|District|Province|City|Area)[^\n]*))',
+    re.IGNORECASE,
+)
+_LOCATION_FALLBACK_RE = re.compile(r'\n\s+([A-Za-z\u4e00-\u9fff][A-Za-z\u4e00-\u9fff\s,\-]+)\n')
+
+# Company, location and time sit in the first few lines of a listing, after
+# the (long, tracking-laden) title and company links. Field scans stop here so
+# an oversized block, like the last item running into the page footer, costs
+# no more than a normal one.
+_FIELD_SCAN_LIMIT = 2048
+
 
 @register_scraper("linkedin")
 class LinkedInScraper(BaseScraper):
@@ -54,11 +107,7 @@ class LinkedInScraper(BaseScraper):
         
         # Always search China-wide for better results, then filter by location
         # The city-specific geoIds don't work well with the guest API
-        geo_id = LOCATION_IDS.get("china")
-        
-        # Build URL - always use "China" in the URL for best results
-        params = f"?keywords={quote(query)}&location=China&geoId={geo_id}&start={start}"
-        return f"{self.base_url}{params}"
+        return f"{self.base_url}?keywords={_quote(query)}&location=China&geoId={_CHINA_GEO_ID}&start={start}"
 
     async def search(
         self,
@@ -82,10 +131,11 @@ class LinkedInScraper(BaseScraper):
 
         try:
             markdown = await self.scrape_url(url)
-            jobs = self.parse_search_results(markdown)
+            # Parse off the event loop so the UI and other requests keep running
+            jobs = await asyncio.to_thread(self.parse_search_results, markdown)
 
             # Filter jobs by location if requested
-            if filter_location and location.lower() not in ["china", "中国"]:
+            if filter_location and location.lower() not in ("china", "中国"):
                 jobs = self._filter_by_location(jobs, location)
 
             # LinkedIn guest API returns up to 25 jobs per page
@@ -135,31 +185,10 @@ class LinkedInScraper(BaseScraper):
         Returns:
             Filtered list of jobs matching the location
         """
-        location_lower = location.lower()
-        
-        # Map common location names to patterns
-        location_patterns = {
-            "beijing": ["beijing", "北京"],
-            "北京": ["beijing", "北京"],
-            "shanghai": ["shanghai", "上海"],
-            "上海": ["shanghai", "上海"],
-            "shenzhen": ["shenzhen", "深圳"],
-            "深圳": ["shenzhen", "深圳"],
-            "guangzhou": ["guangzhou", "广州"],
-            "广州": ["guangzhou", "广州"],
-        }
-        
-        patterns = location_patterns.get(location_lower, [location_lower])
-        
-        filtered = []
-        for job in jobs:
-            job_location = job.location.lower()
-            if any(pattern in job_location for pattern in patterns):
-                filtered.append(job)
-        
-        return filtered
+        patterns = _location_patterns(location)
+        return [job for job in jobs if any(pattern in job.location.lower() for pattern in patterns)]
 
-    def parse_search_results(self, markdown: str) -> list[JobPosting]:
+    def _parse_search_results(self, markdown: str) -> list[JobPosting]:
         """Parse LinkedIn guest API results into job listings.
 
         Args:
@@ -169,6 +198,8 @@ class LinkedInScraper(BaseScraper):
             List of JobPosting objects
         """
         jobs = []
+        # Jobs on one page share a fetch time
+        fetched_at = datetime.now()
 
         # Pattern to match job entries:
         # * [Job Title](URL)
@@ -177,72 +208,83 @@ class LinkedInScraper(BaseScraper):
         #   Location
         #   time ago
         
-        # Split by list items
-        job_blocks = re.split(r'\n\*\s+\[', markdown)
-        
-        for block in job_blocks[1:]:  # Skip first empty split
-            job = self._parse_job_block(block)
+        # Each list item runs until the next one starts. Titles are matched in
+        # place, so only blocks for real job links get sliced out.
+        items = _ITEM_START_RE.finditer(markdown)
+
+        for item, next_item in pairwise(chain(items, (None,))):
+            start = item.end()
+            end = next_item.start() if next_item else len(markdown)
+
+            # Format: Title](URL)
+            title_match = _TITLE_RE.match(markdown, start, end)
+            if not title_match:
+                continue
+
+            # Skip non-job links
+            url = title_match.group(2)
+            if '/jobs/view/' not in url:
+                continue
+
+            # URL decode the title (handles Chinese characters)
+            title = unquote(title_match.group(1).strip())
+
+            job = self._parse_job_block(title, url, markdown[start:end], fetched_at)
             if job:
                 jobs.append(job)
 
         return jobs
 
-    def _parse_job_block(self, block: str) -> Optional[JobPosting]:
+    def _parse_job_block(
+        self,
+        title: str,
+        url: str,
+        block: str,
+        fetched_at: datetime,
+    ) -> Optional[JobPosting]:
         """Parse a single job block from the markdown.
 
         Args:
+            title: Job title
+            url: Job URL
             block: Text block for one job listing
+            fetched_at: When the page was fetched
 
         Returns:
             JobPosting or None if parsing fails
         """
         try:
-            # Extract job title and URL from the first line
-            # Format: Title](URL)
-            title_match = re.match(r'([^\]]+)\]\((https?://[^\)]+)\)', block)
-            if not title_match:
-                return None
-                
-            title = title_match.group(1).strip()
-            url = title_match.group(2)
-            
-            # URL decode the title (handles Chinese characters)
-            title = unquote(title)
-            
-            # Skip non-job links
-            if '/jobs/view/' not in url:
-                return None
-
-            # Extract company name
-            # Pattern: #### [Company Name](company_url)
-            company = "Unknown"
-            company_match = re.search(r'####\s+\[([^\]]+)\]', block)
-            if company_match:
-                company = company_match.group(1).strip()
-
-            # Extract location - usually on its own line after company
-            location = "China"
-            # Look for location patterns (City, Region, Country)
-            location_match = re.search(r'\n\s+([A-Za-z\u4e00-\u9fff][^\n]+(?:China|中国|District|Province|City|Area)[^\n]*)', block, re.IGNORECASE)
-            if location_match:
-                location = location_match.group(1).strip()
-            else:
+            # Extract company name, location and time posted in one pass
+            # Company pattern: #### [Company Name](company_url)
+            # Location is usually on its own line after company
+            company = None
+            location = None
+            posted_text = None
+            for match in _BLOCK_RE.finditer(block, 0, _FIELD_SCAN_LIMIT):
+                kind = match.lastgroup
+                if kind == "company" and company is None:
+                    company = match.group("company_name").strip()
+                elif kind == "loc" and location is None:
+                    location = match.group("loc_text").strip()
+                elif kind == "time" and posted_text is None:
+                    posted_text = f"{match.group('time_n')} {match.group('time_unit')}s ago"
+                if company is not None and location is not None and posted_text is not None:
+                    break
+
+            if company is None:
+                company = "Unknown"
+            if location is None:
+                location = "China"
                 # Try simpler pattern
-                location_match = re.search(r'\n\s+([A-Za-z\u4e00-\u9fff][A-Za-z\u4e00-\u9fff\s,\-]+)\n', block)
+                location_match = _LOCATION_FALLBACK_RE.search(block, 0, _FIELD_SCAN_LIMIT)
                 if location_match:
                     loc_text = location_match.group(1).strip()
                     # Filter out non-location text
-                    if not any(skip in loc_text.lower() for skip in ['applicant', 'ago', 'week', 'month', 'day', 'hour']):
+                    if not any(skip in loc_text.lower() for skip in _NON_LOCATION_WORDS):
                         location = loc_text
 
-            # Extract time posted
-            posted_text = None
-            time_match = re.search(r'(\d+)\s+(hour|day|week|month)s?\s+ago', block, re.IGNORECASE)
-            if time_match:
-                posted_text = f"{time_match.group(1)} {time_match.group(2)}s ago"
-
             # Extract tags from title and block
-            tags = extract_tags(title + " " + block)
+            tags = extract_tags(title, block)
 
             # Generate unique ID from URL
             job_id = self.generate_job_id(url)
@@ -261,8 +303,8 @@ class LinkedInScraper(BaseScraper):
                 posted_date=None,
                 url=url,
                 source=self.name,
-                fetched_at=datetime.now(),
+                fetched_at=fetched_at,
             )
         except Exception as e:
-            print(f"Error parsing LinkedIn job block: {e}")
+            logger.warning("Error parsing LinkedIn job block: %s", e)
             return None
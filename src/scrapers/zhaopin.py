@@ -1,14 +1,20 @@
 """Zhaopin (智联招聘) job scraper."""
 
+import asyncio
+import logging
 import re
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain, pairwise
 from typing import Optional
-from urllib.parse import quote, urljoin
+from urllib.parse import quote
 
 from . import register_scraper
 from .base import BaseScraper
 from ..models import JobPosting, ScraperResult
-from ..utils.parser import extract_salary, extract_experience, extract_tags, normalize_location
+from ..utils.parser import extract_tags
+
+logger = logging.getLogger(__name__)
 
 
 # Zhaopin city codes
@@ -22,6 +28,44 @@ CITY_CODES = {
     "shenzhen": "765",
     "深圳": "765",
 }
+_DEFAULT_CITY_CODE = CITY_CODES["beijing"]
+
+# Also keyed by the capitalized spelling callers usually pass ("Beijing"), so
+# most URL builds find the city without lowercasing it first
+_CITY_CODE_LOOKUP = CITY_CODES | {city.capitalize(): code for city, code in CITY_CODES.items()}
+
+# Paging through results re-quotes the same query, so memoize it
+_quote = lru_cache(maxsize=256)(quote)
+
+# Navigation and action links that share the job link pattern. They are
+# CJK only, so titles can be checked without lowercasing.
+_SKIP_TITLES = ('首页', '职位推荐', '登录', '注册', '收藏', '投递')
+
+# Patterns used when parsing search results, compiled once at import.
+# Link text excludes "[" and URLs exclude whitespace, so an unclosed "[" or
+# "(" stops at the next bracket or space instead of scanning to the end of
+# the page (quadratic on bracket-heavy pages).
+_JOB_LINK_RE = re.compile(r'\[([^\[\]]+)\]\((https?://(?:www\.)?zhaopin\.com/jobdetail/[^\s\)]+)\)')
+# Tried in order; the 万 pattern covers both "1.5-3万" and "2-3万·16薪"
+_SALARY_RES = [
+    re.compile(r'(\d+(?:\.\d+)?-\d+(?:\.\d+)?万(?:·\d+薪)?)'),  # 1.5-3万 or 2-3万·16薪
+    re.compile(r'(\d{4,}-\d{4,}元)'),  # 6000-9000元
+]
+_LOCATION_RE = re.compile(r'北京[·\s]*([^\s\n]+)?')
+_EXPERIENCE_RE = re.compile(r'(\d+-\d+年|经验不限|\d+年以上)')
+_EDUCATION_RE = re.compile(r'(本科|硕士|博士|大专|学历不限)')
+_EDUCATION_LEVELS = {
+    "本科": "Bachelor",
+    "硕士": "Master",
+    "博士": "PhD",
+    "大专": "Associate",
+    "学历不限": "Not Required",
+}
+_COMPANY_RE = re.compile(r'\[([^\[\]]+)\]\([^\s\)]*companydetail[^\s\)]*\)')
+_SKILL_TAG_RE = re.compile(
+    r'(?:^|\s)(Python|Java|C\+\+|Go|MySQL|Redis|Django|Flask|Docker|Kubernetes|Spring|PostgreSQL|MongoDB|Oracle|JavaScript|Vue|React|Node\.js)(?:\s|$)',
+    re.IGNORECASE,
+)
 
 
 @register_scraper("zhaopin")
@@ -48,12 +92,11 @@ class ZhaopinScraper(BaseScraper):
             Full search URL
         """
         # Get city code
-        city_code = CITY_CODES.get(location.lower(), CITY_CODES.get("beijing"))
+        city_code = _CITY_CODE_LOOKUP.get(location) or _CITY_CODE_LOOKUP.get(location.lower(), _DEFAULT_CITY_CODE)
 
         # Build URL with parameters
         # jl = city code, kw = keyword, p = page, kt = search type (3 = title)
-        params = f"?jl={city_code}&kw={quote(query)}&p={page}&kt=3"
-        return f"{self.base_url}{params}"
+        return f"{self.base_url}?jl={city_code}&kw={_quote(query)}&p={page}&kt=3"
 
     async def search(
         self,
@@ -75,7 +118,8 @@ class ZhaopinScraper(BaseScraper):
 
         try:
             markdown = await self.scrape_url(url)
-            jobs = self.parse_search_results(markdown)
+            # Parse off the event loop so the UI and other requests keep running
+            jobs = await asyncio.to_thread(self.parse_search_results, markdown)
 
             # Determine if there are more pages
             has_more = len(jobs) >= 15  # Zhaopin typically shows 15-20 jobs per page
@@ -110,7 +154,7 @@ class ZhaopinScraper(BaseScraper):
         # Can implement detail page scraping later if needed
         return None
 
-    def parse_search_results(self, markdown: str) -> list[JobPosting]:
+    def _parse_search_results(self, markdown: str) -> list[JobPosting]:
         """Parse Zhaopin search results markdown into job listings.
 
         Args:
@@ -120,6 +164,8 @@ class ZhaopinScraper(BaseScraper):
             List of JobPosting objects
         """
         jobs = []
+        # Jobs on one page share a fetch time
+        fetched_at = datetime.now()
 
         # Split by job entries - each job starts with a link in markdown format
         # Pattern: [Job Title](URL)
@@ -128,38 +174,44 @@ class ZhaopinScraper(BaseScraper):
         # Find all job blocks - they follow a consistent pattern
         # [Title](url) ... salary ... location ... experience ... education ... [Company](url)
 
-        # Pattern to find job title links
-        job_pattern = r'\[([^\]]+)\]\((https?://(?:www\.)?zhaopin\.com/jobdetail/[^\)]+)\)'
-
-        matches = list(re.finditer(job_pattern, markdown))
+        # Walk matches alongside the next one (None after the last) to find
+        # where each block ends, without materializing every match
+        matches = _JOB_LINK_RE.finditer(markdown)
 
-        for i, match in enumerate(matches):
+        for match, next_match in pairwise(chain(matches, (None,))):
             title = match.group(1).strip()
             url = match.group(2)
 
             # Skip navigation links and non-job links
-            if any(skip in title.lower() for skip in ['首页', '职位推荐', '登录', '注册', '收藏', '投递']):
+            if any(skip in title for skip in _SKIP_TITLES):
                 continue
 
             # Get the text block after this job title until next job or end
             start_pos = match.end()
-            end_pos = matches[i + 1].start() if i + 1 < len(matches) else len(markdown)
+            end_pos = next_match.start() if next_match else len(markdown)
             block = markdown[start_pos:end_pos]
 
             # Extract job details from the block
-            job = self._parse_job_block(title, url, block)
+            job = self._parse_job_block(title, url, block, fetched_at)
             if job:
                 jobs.append(job)
 
         return jobs
 
-    def _parse_job_block(self, title: str, url: str, block: str) -> Optional[JobPosting]:
+    def _parse_job_block(
+        self,
+        title: str,
+        url: str,
+        block: str,
+        fetched_at: datetime,
+    ) -> Optional[JobPosting]:
         """Parse a single job block from the markdown.
 
         Args:
             title: Job title
             url: Job URL
             block: Text block containing job details
+            fetched_at: When the page was fetched
 
         Returns:
             JobPosting or None if parsing fails
@@ -167,13 +219,8 @@ class ZhaopinScraper(BaseScraper):
         try:
             # Extract salary - patterns like "1.5-3万", "6000-9000元", "2-3万·16薪"
             salary = None
-            salary_patterns = [
-                r'(\d+(?:\.\d+)?-\d+(?:\.\d+)?万(?:·\d+薪)?)',  # 1.5-3万 or 2-3万·16薪
-                r'(\d{4,}-\d{4,}元)',  # 6000-9000元
-                r'(\d+(?:\.\d+)?-\d+(?:\.\d+)?万)',  # 1.5-3万
-            ]
-            for pattern in salary_patterns:
-                salary_match = re.search(pattern, block)
+            for pattern in _SALARY_RES:
+                salary_match = pattern.search(block)
                 if salary_match:
                     salary = salary_match.group(1)
                     break
@@ -184,14 +231,14 @@ class ZhaopinScraper(BaseScraper):
 
             # Extract location - pattern like "北京·海淀" or "北京·海淀·上地"
             location = "Beijing"
-            location_match = re.search(r'北京[·\s]*([^\s\n]+)?', block)
+            location_match = _LOCATION_RE.search(block)
             if location_match:
                 district = location_match.group(1) if location_match.group(1) else ""
                 location = f"Beijing, {district}".rstrip(", ")
 
             # Extract experience - patterns like "1-3年", "经验不限", "5-10年"
             experience = None
-            exp_match = re.search(r'(\d+-\d+年|经验不限|\d+年以上)', block)
+            exp_match = _EXPERIENCE_RE.search(block)
             if exp_match:
                 exp_text = exp_match.group(1)
                 if exp_text == "经验不限":
@@ -201,20 +248,13 @@ class ZhaopinScraper(BaseScraper):
 
             # Extract education - patterns like "本科", "硕士", "大专"
             education = None
-            edu_match = re.search(r'(本科|硕士|博士|大专|学历不限)', block)
+            edu_match = _EDUCATION_RE.search(block)
             if edu_match:
-                edu_map = {
-                    "本科": "Bachelor",
-                    "硕士": "Master",
-                    "博士": "PhD",
-                    "大专": "Associate",
-                    "学历不限": "Not Required",
-                }
-                education = edu_map.get(edu_match.group(1), edu_match.group(1))
+                education = _EDUCATION_LEVELS.get(edu_match.group(1), edu_match.group(1))
 
             # Extract company name - pattern: [Company Name](company_url)
             company = "Unknown"
-            company_match = re.search(r'\[([^\]]+)\]\([^\)]*companydetail[^\)]*\)', block)
+            company_match = _COMPANY_RE.search(block)
             if company_match:
                 company = company_match.group(1).strip()
 
@@ -222,7 +262,7 @@ class ZhaopinScraper(BaseScraper):
             tags = extract_tags(block)
 
             # Also look for explicit skill tags in the markdown
-            skill_tags = re.findall(r'(?:^|\s)(Python|Java|C\+\+|Go|MySQL|Redis|Django|Flask|Docker|Kubernetes|Spring|PostgreSQL|MongoDB|Oracle|JavaScript|Vue|React|Node\.js)(?:\s|$)', block, re.IGNORECASE)
+            skill_tags = _SKILL_TAG_RE.findall(block)
             for tag in skill_tags:
                 if tag not in tags:
                     tags.append(tag)
@@ -244,11 +284,11 @@ class ZhaopinScraper(BaseScraper):
                 posted_date=None,
                 url=url,
                 source=self.name,
-                fetched_at=datetime.now(),
+                fetched_at=fetched_at,
             )
         except Exception as e:
             # Log error but don't fail
-            print(f"Error parsing job block: {e}")
+            logger.warning("Error parsing job block: %s", e)
             return None
 
     def _normalize_salary(self, salary_str: str) -> str:
@@ -260,19 +300,22 @@ class ZhaopinScraper(BaseScraper):
         Returns:
             Normalized salary like "15k-30k" (monthly)
         """
-        # Handle 万 (10k) format
-        wan_match = re.search(r'(\d+(?:\.\d+)?)-(\d+(?:\.\d+)?)万', salary_str)
-        if wan_match:
-            low = float(wan_match.group(1)) * 10
-            high = float(wan_match.group(2)) * 10
-            return f"{int(low)}k-{int(high)}k"
-
-        # Handle 元 format (assume monthly)
-        yuan_match = re.search(r'(\d+)-(\d+)元', salary_str)
-        if yuan_match:
-            low = int(yuan_match.group(1)) // 1000
-            high = int(yuan_match.group(2)) // 1000
-            return f"{low}k-{high}k"
+        # Salaries come from _SALARY_RES, so they are "<low>-<high>" followed
+        # by the unit; split them apart instead of matching another regex
+        low, _, rest = salary_str.partition("-")
+
+        try:
+            # Handle 万 (10k) format
+            high, wan, _ = rest.partition("万")
+            if wan:
+                return f"{int(float(low) * 10)}k-{int(float(high) * 10)}k"
+
+            # Handle 元 format (assume monthly)
+            high, yuan, _ = rest.partition("元")
+            if yuan:
+                return f"{int(low) // 1000}k-{int(high) // 1000}k"
+        except ValueError:
+            pass
 
         return salary_str
 
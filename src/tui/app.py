@@ -1,13 +1,17 @@
 """Main TUI application for jobs-cli."""
 
 import asyncio
+import time
 import webbrowser
-from typing import Optional
+from itertools import islice
+from typing import Any, Awaitable, Callable, Optional
 
+from rich.markup import escape
 from textual import on, work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Vertical
+from textual.coordinate import Coordinate
 from textual.screen import ModalScreen
 from textual.widgets import (
     DataTable,
@@ -22,10 +26,19 @@ from ..cache.database import Database
 from ..client.mcp_client import BrightDataMCP
 from ..config import get_settings
 from ..models import JobPosting
+from ..scrapers.base import BaseScraper
 from ..scrapers.zhaopin import ZhaopinScraper
 from ..scrapers.linkedin import LinkedInScraper
 from ..utils.parser import parse_salary_min, parse_experience_years
 
+# Cached jobs are loaded into the table a page at a time, fetching the next
+# page once the cursor is within _TABLE_PREFETCH_ROWS of the last loaded row
+_TABLE_PAGE_SIZE = 40
+_TABLE_PREFETCH_ROWS = 10
+
+# Seconds the status bar reuses API usage and job counts before re-reading them
+_STATS_TTL = 2.0
+
 
 def filter_jobs(
     jobs: list[JobPosting],
@@ -42,8 +55,11 @@ def filter_jobs(
         exp: Experience filter (e.g., "3-5" or "5+")
 
     Returns:
-        Filtered list of jobs
+        Filtered list of jobs (``jobs`` itself when no filter is set)
     """
+    if not tech and salary_min is None and not exp:
+        return jobs
+
     filtered = jobs
 
     # Filter by tech tags
@@ -92,6 +108,16 @@ def filter_jobs(
     return filtered
 
 
+def _job_row(index: int, job: JobPosting) -> tuple[str, ...]:
+    """Format a job as a row of the jobs table, truncating long fields."""
+    salary = f"{job.salary_range}" if job.salary_range else "-"
+    title = job.title[:30] + "..." if len(job.title) > 30 else job.title
+    company = job.company[:20] + "..." if len(job.company) > 20 else job.company
+    location = job.location[:15] + "..." if len(job.location) > 15 else job.location
+    source = job.source or "-"
+    return (str(index), title, company, salary, location, source)
+
+
 # =============================================================================
 # Modal Screens
 # =============================================================================
@@ -568,8 +594,6 @@ class JobDetail(Static):
 
     def show_job(self, job: JobPosting) -> None:
         """Display job details."""
-        from rich.markup import escape
-        
         self.job = job
         
         # Format salary
@@ -693,6 +717,24 @@ class JobsApp(App):
         self.current_location: str = "Beijing"
         self.filters: dict = {}
         self.command_mode_active: bool = False
+        # Lazy paging state for the cached job list shown by load_jobs
+        self._more_cached: bool = False
+        self._loading_more: bool = False
+        self._next_cursor: Optional[str] = None
+        # Cells of each table row by job ID, in table order; None when a job
+        # is listed twice and the rows can't be keyed by ID
+        self._table_rows: Optional[dict[str, tuple[str, ...]]] = {}
+        # Short-lived API usage and job counts, keyed by stat name
+        self._stats_cache: dict[str, tuple[float, Any]] = {}
+        # One API session, opened on mount, and one scraper per platform,
+        # shared by every search and refresh
+        self._mcp_ready: Optional[asyncio.Future] = None
+        self._mcp_task: Optional[asyncio.Task] = None
+        # Wakes the session task to reopen a dropped session, or to close it
+        # once _mcp_closing is set
+        self._mcp_wake = asyncio.Event()
+        self._mcp_closing = False
+        self._scrapers: dict[str, BaseScraper] = {}
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -705,7 +747,14 @@ class JobsApp(App):
 
     async def on_mount(self) -> None:
         """Initialize the app on mount."""
-        self.db = Database()
+        # Browsing repeats the same queries; reuse results for a minute
+        self.db = Database(query_cache_ttl=60)
+
+        # Connect to the API in the background, so a search that misses the
+        # cache finds the session already open
+        if get_settings().bright_data_api_token:
+            self._mcp_ready = asyncio.get_running_loop().create_future()
+            self._mcp_task = asyncio.create_task(self._hold_mcp())
         
         # Setup table
         table = self.query_one("#job-table", DataTable)
@@ -722,6 +771,15 @@ class JobsApp(App):
         # Update status bar
         await self.update_status()
 
+    async def on_unmount(self) -> None:
+        """Close the API session and database connection on shutdown."""
+        self._mcp_closing = True
+        self._mcp_wake.set()
+        if self._mcp_task is not None:
+            await self._mcp_task
+        if self.db is not None:
+            await self.db.close()
+
     # =========================================================================
     # Modal Actions
     # =========================================================================
@@ -875,6 +933,17 @@ class JobsApp(App):
                 detail.show_job(self.selected_job)
                 self.detail_visible = True
 
+    @on(DataTable.RowHighlighted)
+    def on_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        """Load the next page of cached jobs as the cursor nears the end."""
+        if (
+            self._more_cached
+            and not self._loading_more
+            and event.cursor_row >= len(self.jobs) - _TABLE_PREFETCH_ROWS
+        ):
+            self._loading_more = True
+            self.run_worker(self._load_more_worker())
+
     @on(Input.Submitted, "#command-input")
     def on_command_input_submitted(self, event: Input.Submitted) -> None:
         """Handle command input submission (only from #command-input)."""
@@ -958,30 +1027,56 @@ class JobsApp(App):
     # =========================================================================
 
     async def load_jobs(self, search_query: str = "") -> None:
-        """Load jobs from cache."""
+        """Load the first page of jobs from cache.
+
+        Further pages are loaded as the cursor moves down the table.
+        """
         if self.db is None:
             return
 
-        if search_query:
-            self.jobs = await self.db.search_jobs(search_query, limit=100)
-            self.current_search = search_query
-        else:
-            self.jobs = await self.db.get_jobs(limit=100)
-            self.current_search = ""
+        self.current_search = search_query
+        self._more_cached = False
+        self._next_cursor = None
+        self.jobs = []
+        jobs, more = await self._fetch_cached_page()
+        self.jobs = jobs
 
         # Update table
-        table = self.query_one("#job-table", DataTable)
-        table.clear()
-        
-        for i, job in enumerate(self.jobs, 1):
-            salary = f"{job.salary_range}" if job.salary_range else "-"
-            title = job.title[:30] + "..." if len(job.title) > 30 else job.title
-            company = job.company[:20] + "..." if len(job.company) > 20 else job.company
-            location = job.location[:15] + "..." if len(job.location) > 15 else job.location
-            source = job.source or "-"
-            
-            table.add_row(str(i), title, company, salary, location, source)
+        await self.refresh_table()
+        self._more_cached = more
+        await self.update_status()
+
+    async def _fetch_cached_page(self) -> tuple[list[JobPosting], bool]:
+        """Fetch the cached jobs following the ones already loaded.
+
+        Returns:
+            Tuple of (jobs, whether more pages may follow)
+        """
+        if self.current_search:
+            jobs = await self.db.search_jobs(
+                self.current_search, limit=_TABLE_PAGE_SIZE, offset=len(self.jobs)
+            )
+            return jobs, len(jobs) == _TABLE_PAGE_SIZE
+
+        jobs, self._next_cursor = await self.db.get_jobs_page(
+            limit=_TABLE_PAGE_SIZE, cursor=self._next_cursor
+        )
+        return jobs, self._next_cursor is not None
 
+    async def _load_more_worker(self) -> None:
+        """Worker for appending the next page of cached jobs to the table."""
+        try:
+            shown = self.jobs
+            jobs, more = await self._fetch_cached_page()
+            # Skip the page if a search or refresh replaced the list meanwhile
+            if self.jobs is not shown or not self._more_cached:
+                return
+            table = self.query_one("#job-table", DataTable)
+            self._add_job_rows(table, jobs, len(self.jobs) + 1)
+            self.jobs.extend(jobs)
+            self._more_cached = more
+        finally:
+            self._loading_more = False
         await self.update_status()
 
     async def update_status(self) -> None:
@@ -989,7 +1084,7 @@ class JobsApp(App):
         if self.db is None:
             return
             
-        stats = await self.db.get_monthly_usage()
+        stats = await self._cached_stat("monthly_usage", self.db.get_monthly_usage)
         job_count = len(self.jobs)
         
         status = self.query_one("#status-bar", StatusBar)
@@ -1006,18 +1101,75 @@ class JobsApp(App):
         )
 
     async def refresh_table(self) -> None:
-        """Refresh the jobs table display."""
+        """Refresh the jobs table display.
+
+        When the new list keeps the shown jobs in order and only drops some
+        of them or adds jobs after them (loading more, a tighter filter),
+        just the rows that differ are touched. Anything else rebuilds the
+        table.
+        """
+        # A refresh shows a list that isn't paged in lazily; load_jobs
+        # turns paging back on for its own list
+        self._more_cached = False
         table = self.query_one("#job-table", DataTable)
+
+        shown = self._table_rows
+        if shown:
+            rows = {job.id: _job_row(i, job) for i, job in enumerate(self.jobs, 1)}
+            kept = [job_id for job_id in shown if job_id in rows]
+            # Each removal shifts every row below it, so past this point a
+            # rebuild is cheaper
+            if (
+                kept
+                and len(shown) - len(kept) <= len(kept)
+                and len(rows) == len(self.jobs)
+                and all(job.id == job_id for job, job_id in zip(self.jobs, kept))
+            ):
+                for job_id in shown.keys() - rows.keys():
+                    table.remove_row(job_id)
+                for index, job_id in enumerate(kept):
+                    for column, (old, new) in enumerate(zip(shown[job_id], rows[job_id])):
+                        if old != new:
+                            table.update_cell_at(Coordinate(index, column), new, update_width=True)
+                self._table_rows = dict(islice(rows.items(), len(kept)))
+                self._add_job_rows(table, self.jobs[len(kept):], len(kept) + 1)
+                return
+
         table.clear()
-        
-        for i, job in enumerate(self.jobs, 1):
-            salary = f"{job.salary_range}" if job.salary_range else "-"
-            title = job.title[:30] + "..." if len(job.title) > 30 else job.title
-            company = job.company[:20] + "..." if len(job.company) > 20 else job.company
-            location = job.location[:15] + "..." if len(job.location) > 15 else job.location
-            source = job.source or "-"
-            
-            table.add_row(str(i), title, company, salary, location, source)
+        self._table_rows = {}
+        self._add_job_rows(table, self.jobs, 1)
+
+    def _add_job_rows(self, table: DataTable, jobs: list[JobPosting], start: int) -> None:
+        """Add rows for ``jobs`` at the bottom of the table, numbered from ``start``.
+
+        Rows are keyed by job ID. A job that is already shown can't reuse its
+        key, so from then on rows go in unkeyed and the next refresh rebuilds
+        the table.
+        """
+        rows = self._table_rows
+        for i, job in enumerate(jobs, start):
+            row = _job_row(i, job)
+            if rows is not None and job.id not in rows:
+                table.add_row(*row, key=job.id)
+                rows[job.id] = row
+            else:
+                table.add_row(*row)
+                rows = None
+        self._table_rows = rows
+
+    async def _cached_stat(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Get a status value, re-reading it with ``fetch`` once it expires.
+
+        Writes that change these values clear the cache right away, so the
+        TTL only spares repeated reads between them.
+        """
+        now = time.monotonic()
+        entry = self._stats_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        value = await fetch()
+        self._stats_cache[key] = (now + _STATS_TTL, value)
+        return value
 
     async def _update_status_worker(self) -> None:
         """Worker for updating status bar."""
@@ -1052,8 +1204,10 @@ class JobsApp(App):
         if self.db is None:
             return
             
-        stats = await self.db.get_monthly_usage()
-        job_count = await self.db.get_job_count()
+        stats, job_count = await asyncio.gather(
+            self._cached_stat("monthly_usage", self.db.get_monthly_usage),
+            self._cached_stat("job_count", self.db.get_job_count),
+        )
         
         self.notify(
             f"API: {stats.requests_used}/{stats.monthly_limit} | "
@@ -1114,8 +1268,7 @@ class JobsApp(App):
         status.set_loading(True, f"Fetching from {platform} API...")
         
         try:
-            settings = get_settings()
-            if not settings.bright_data_api_token:
+            if self._mcp_ready is None:
                 self.notify("API token not configured", severity="error")
                 return
 
@@ -1126,31 +1279,36 @@ class JobsApp(App):
             else:
                 scrapers_to_use = [platform]
             
+            requests_made = 0
             for scraper_name in scrapers_to_use:
                 try:
                     status.set_loading(True, f"Fetching from {scraper_name}...")
-                    mcp = BrightDataMCP()
-                    
                     if scraper_name == "zhaopin":
-                        scraper = ZhaopinScraper(mcp)
+                        scraper = await self._shared_scraper(ZhaopinScraper)
                         result = await scraper.search(query, location, page=page)
                     elif scraper_name == "linkedin":
-                        scraper = LinkedInScraper(mcp)
+                        scraper = await self._shared_scraper(LinkedInScraper)
                         result = await scraper.search(query, location, page=page, filter_location=True)
                     else:
                         continue
-                    
-                    await self.db.increment_request_count(1)
-                    
+                
+                    requests_made += 1
+                
                     if result.jobs:
                         all_jobs.extend(result.jobs)
                         self.has_more = self.has_more or result.has_more
-                    
+                
                 except Exception as e:
                     self.notify(f"{scraper_name} error: {e}", severity="warning")
+
+            # One counter write for every request that reached the API
+            if requests_made:
+                await self.db.increment_request_count(requests_made)
+                self._stats_cache.clear()
             
             if all_jobs:
                 await self.db.save_jobs(all_jobs)
+                self._stats_cache.clear()
                 
                 filtered = filter_jobs(
                     all_jobs,
@@ -1188,6 +1346,48 @@ class JobsApp(App):
 
         await self.update_status()
 
+    async def _hold_mcp(self) -> None:
+        """Keep an MCP session open, handing the client out through ``_mcp_ready``.
+
+        The session's transport has to be closed by the task that opened it,
+        so it lives in this task. Each wake-up closes the current session
+        and, unless the app is closing, opens a new one on the same client.
+        """
+        try:
+            mcp = BrightDataMCP()
+            while not self._mcp_closing:
+                async with mcp:
+                    if not self._mcp_ready.done():
+                        self._mcp_ready.set_result(mcp)
+                    await self._mcp_wake.wait()
+                    self._mcp_wake.clear()
+        except Exception as e:
+            if not self._mcp_ready.done():
+                self._mcp_ready.set_exception(e)
+        finally:
+            if not self._mcp_ready.done():
+                self._mcp_ready.cancel()
+
+    async def _shared_scraper(self, scraper_cls: type[BaseScraper]) -> BaseScraper:
+        """Get the app's scraper for a platform, waiting for the API session.
+
+        One instance per platform is kept, so its request throttle carries
+        over from one search to the next.
+        """
+        # Shielded so cancelling a search doesn't cancel the shared session
+        mcp = await asyncio.shield(self._mcp_ready)
+        if not mcp.connected:
+            # The session was dropped (idle timeout, server restart) or never
+            # opened; have the session task open a new one and wait for it
+            self._mcp_ready = asyncio.get_running_loop().create_future()
+            self._mcp_wake.set()
+            mcp = await asyncio.shield(self._mcp_ready)
+
+        scraper = self._scrapers.get(scraper_cls.name)
+        if scraper is None:
+            scraper = self._scrapers.setdefault(scraper_cls.name, scraper_cls(mcp))
+        return scraper
+
     @work(exclusive=True)
     async def do_refresh(self, query: str) -> None:
         """Refresh jobs from API."""
@@ -1203,8 +1403,7 @@ class JobsApp(App):
             return
 
         try:
-            settings = get_settings()
-            if not settings.bright_data_api_token:
+            if self._mcp_ready is None:
                 self.notify("API token not configured", severity="error")
                 status.set_loading(False)
                 return
@@ -1216,32 +1415,40 @@ class JobsApp(App):
             else:
                 scrapers_to_use = [platform]
             
+            refreshed: list[str] = []
             for scraper_name in scrapers_to_use:
                 try:
                     status.set_loading(True, f"Fetching from {scraper_name}...")
-                    mcp = BrightDataMCP()
-                    
                     if scraper_name == "zhaopin":
-                        scraper = ZhaopinScraper(mcp)
+                        scraper = await self._shared_scraper(ZhaopinScraper)
                         result = await scraper.search(query, location)
                     elif scraper_name == "linkedin":
-                        scraper = LinkedInScraper(mcp)
+                        scraper = await self._shared_scraper(LinkedInScraper)
                         result = await scraper.search(query, location, filter_location=True)
                     else:
                         continue
-                    
-                    await self.db.increment_request_count(1)
-                    await self.db.set_last_refresh(scraper_name)
-                    
+                
+                    refreshed.append(scraper_name)
+                
                     if result.jobs:
                         all_jobs.extend(result.jobs)
-                        
+                    
                 except Exception as e:
                     self.notify(f"{scraper_name} error: {e}", severity="warning")
+
+            # The refresh times, request counter and jobs don't depend on each
+            # other, so issue the writes together
+            writes = [self.db.set_last_refresh(name) for name in refreshed]
+            if refreshed:
+                # One counter write for every request that reached the API
+                writes.append(self.db.increment_request_count(len(refreshed)))
+            if all_jobs:
+                writes.append(self.db.save_jobs(all_jobs))
+            if writes:
+                await asyncio.gather(*writes)
+                self._stats_cache.clear()
             
             if all_jobs:
-                await self.db.save_jobs(all_jobs)
-                
                 if self.current_search:
                     all_cached = await self.db.search_jobs(self.current_search, limit=500)
                 else:
@@ -1,6 +1,7 @@
 """Utility functions for parsing job data from markdown."""
 
 import re
+from functools import lru_cache
 from typing import Optional
 
 
@@ -134,94 +135,98 @@ def normalize_location(text: str) -> str:
     return text.strip()
 
 
-def extract_tags(text: str) -> list[str]:
+# Common tech keywords to look for
+_TECH_KEYWORDS = [
+    "Python",
+    "Java",
+    "JavaScript",
+    "TypeScript",
+    "Go",
+    "Golang",
+    "Rust",
+    "C++",
+    "C#",
+    "Ruby",
+    "PHP",
+    "Swift",
+    "Kotlin",
+    "React",
+    "Vue",
+    "Angular",
+    "Node.js",
+    "Django",
+    "Flask",
+    "FastAPI",
+    "Spring",
+    "SpringBoot",
+    "Docker",
+    "Kubernetes",
+    "K8s",
+    "AWS",
+    "Azure",
+    "GCP",
+    "MySQL",
+    "PostgreSQL",
+    "MongoDB",
+    "Redis",
+    "Elasticsearch",
+    "Kafka",
+    "RabbitMQ",
+    "Linux",
+    "Git",
+    "CI/CD",
+    "DevOps",
+    "Microservices",
+    "REST",
+    "GraphQL",
+    "gRPC",
+    "Machine Learning",
+    "ML",
+    "AI",
+    "Deep Learning",
+    "TensorFlow",
+    "PyTorch",
+    "NLP",
+    "Computer Vision",
+]
+
+# Spellings that are reported under a canonical tag
+_TAG_ALIASES = {"golang": "Go", "k8s": "Kubernetes", "springboot": "Spring Boot"}
+
+# (lowercased keyword, tag) pairs, so extract_tags does no per-call setup
+_TECH_TAGS = tuple(
+    (keyword.lower(), _TAG_ALIASES.get(keyword.lower(), keyword)) for keyword in _TECH_KEYWORDS
+)
+
+
+def extract_tags(*texts: str) -> list[str]:
     """Extract technology/skill tags from text.
 
     Args:
-        text: Text containing skill mentions
+        *texts: Texts containing skill mentions. Each is searched on its own,
+            so callers don't need to join them first.
 
     Returns:
         List of extracted tags
     """
-    if not text:
+    texts_lower = [text.lower() for text in texts if text]
+    if not texts_lower:
         return []
 
-    # Common tech keywords to look for
-    tech_keywords = [
-        "Python",
-        "Java",
-        "JavaScript",
-        "TypeScript",
-        "Go",
-        "Golang",
-        "Rust",
-        "C++",
-        "C#",
-        "Ruby",
-        "PHP",
-        "Swift",
-        "Kotlin",
-        "React",
-        "Vue",
-        "Angular",
-        "Node.js",
-        "Django",
-        "Flask",
-        "FastAPI",
-        "Spring",
-        "SpringBoot",
-        "Docker",
-        "Kubernetes",
-        "K8s",
-        "AWS",
-        "Azure",
-        "GCP",
-        "MySQL",
-        "PostgreSQL",
-        "MongoDB",
-        "Redis",
-        "Elasticsearch",
-        "Kafka",
-        "RabbitMQ",
-        "Linux",
-        "Git",
-        "CI/CD",
-        "DevOps",
-        "Microservices",
-        "REST",
-        "GraphQL",
-        "gRPC",
-        "Machine Learning",
-        "ML",
-        "AI",
-        "Deep Learning",
-        "TensorFlow",
-        "PyTorch",
-        "NLP",
-        "Computer Vision",
-    ]
-
     found_tags = []
-    text_lower = text.lower()
 
-    for tag in tech_keywords:
+    for keyword, tag in _TECH_TAGS:
         # Case-insensitive search but preserve original casing
-        if tag.lower() in text_lower:
-            # Normalize some tags
-            normalized = tag
-            if tag.lower() == "golang":
-                normalized = "Go"
-            elif tag.lower() == "k8s":
-                normalized = "Kubernetes"
-            elif tag.lower() == "springboot":
-                normalized = "Spring Boot"
-
-            if normalized not in found_tags:
-                found_tags.append(normalized)
+        for text_lower in texts_lower:
+            if keyword in text_lower:
+                if tag not in found_tags:
+                    found_tags.append(tag)
+                break
 
     return found_tags
 
 
+@lru_cache(maxsize=4096)
 def parse_salary_min(salary_range: Optional[str]) -> Optional[int]:
     """Parse the minimum salary from a salary range string.
 
@@ -247,6 +252,7 @@ def parse_salary_min(salary_range: Optional[str]) -> Optional[int]:
     return None
 
 
+@lru_cache(maxsize=4096)
 def parse_experience_years(exp_str: Optional[str]) -> Optional[tuple[int, int | None]]:
     """Parse experience string into (min, max) years.
 